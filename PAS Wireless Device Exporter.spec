@@ -0,0 +1,82 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Spec used by build_windows.py (onedir build, zipped afterwards)
+
+import os
+
+from PyInstaller.utils.hooks import collect_submodules
+
+block_cipher = None
+
+icon_file = os.path.join(SPECPATH, 'icon.ico')
+
+# Generated by build_windows.py from VERSION
+version_file = os.path.join(SPECPATH, 'build', 'version.txt')
+
+# UPX recompresses every binary on every build; only pay for it in release builds
+use_upx = bool(os.environ.get('BUILD_RELEASE'))
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    datas=[('main.py', '.')],
+    hiddenimports=collect_submodules(
+        'pymodbus',
+        filter=lambda name: not name.startswith('pymodbus.server'),
+    ) + collect_submodules('openpyxl') + [
+        'tkinter',
+        'tkinter.filedialog',
+        'tkinter.messagebox',
+    ],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    # Stdlib trees the application never imports; keeps the analysis graph small
+    excludes=[
+        'test',
+        'unittest',
+        'pydoc_data',
+        'distutils',
+        'xmlrpc',
+        'lib2to3',
+        'email.test',
+        'tkinter.test',
+    ],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='PAS Wireless Device Exporter',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=use_upx,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=icon_file if os.path.exists(icon_file) else None,
+    version=version_file if os.path.exists(version_file) else None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=use_upx,
+    upx_exclude=[],
+    name='PAS Wireless Device Exporter',
+)
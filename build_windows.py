@@ -8,62 +8,333 @@ import os
 import sys
 import subprocess
 import shutil
+import hashlib
+import threading
+import atexit
+import json
+import argparse
+import logging
+import re
 
-def run_command(cmd):
-    """Run a command and return the result"""
-    print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"Error: {result.stderr}")
+log = logging.getLogger(__name__)
+
+APP_NAME = 'PAS Wireless Device Exporter'
+APP_DIR = os.path.join('dist', APP_NAME)
+APP_EXE = os.path.join(APP_DIR, APP_NAME + '.exe')
+SPEC_FILE = APP_NAME + '.spec'
+
+# Fully pinned, hash-checked requirements; used instead of requirements.txt when present.
+# Generate it on Windows with: pip-compile --generate-hashes -o requirements.lock requirements.txt
+REQUIREMENTS_LOCK = 'requirements.lock'
+
+# Files whose content determines the executable
+BUILD_INPUTS = ['main.py', 'requirements.txt', REQUIREMENTS_LOCK, SPEC_FILE, 'icon.ico', 'VERSION']
+
+# Fixed timestamp for reproducible builds (override with SOURCE_DATE_EPOCH)
+SOURCE_DATE_EPOCH = os.environ.get('SOURCE_DATE_EPOCH', '1700000000')
+# Tracked input files are only touched when the caller asked for a specific epoch
+SOURCE_DATE_EPOCH_EXPLICIT = 'SOURCE_DATE_EPOCH' in os.environ
+
+# Windows version resource, generated from VERSION and picked up by the spec file
+VERSION_FILE = os.path.join('build', 'version.txt')
+
+# Local wheel directory; when it exists, installs never contact the package index
+WHEELHOUSE = 'wheelhouse'
+
+# Hash of the last successfully installed requirements file
+REQUIREMENTS_MARKER = os.path.join('build', '.reqs.sha256')
+
+# Input hashes and arguments of the last successful build
+BUILD_MANIFEST = os.path.join('build', '.build-manifest.json')
+
+# Hash of the onedir tree that the current zip archive was created from
+ARCHIVE_MARKER = os.path.join('build', '.dist.sha256')
+
+# PyInstaller cache and work directories; keep them on fast local storage
+# (LOCALAPPDATA is never part of a roaming profile on Windows)
+LOCAL_CACHE_ROOT = os.environ.get('LOCALAPPDATA', os.path.expanduser('~/.cache'))
+PYI_CONFIG_DIR = os.environ.get('PYINSTALLER_CONFIG_DIR', os.path.join(LOCAL_CACHE_ROOT, 'pyi-cache'))
+PYI_WORK_DIR = os.environ.get('PYI_WORK_DIR', os.path.join(LOCAL_CACHE_ROOT, 'pyi-work'))
+
+# Persistent pip cache so downloaded and locally built wheels survive between builds
+PIP_CACHE_DIR = os.environ.get('PIP_CACHE_DIR', os.path.expanduser('~/.cache/pip-build-windows'))
+
+def run_command(cmd, env=None):
+    """Run a command, streaming its output, and return whether it succeeded"""
+    log.debug("Running: %s", cmd)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1, env=env)
+    # The pipe must always be drained, but only echo it when INFO output is wanted;
+    # otherwise keep it so the output of a failing command is still shown
+    echo = log.isEnabledFor(logging.INFO)
+    held = []
+    for line in proc.stdout:
+        if echo:
+            sys.stdout.write(line)
+        else:
+            held.append(line)
+    proc.stdout.close()
+    returncode = proc.wait()
+    if returncode != 0:
+        sys.stdout.writelines(held)
+        print(f"Error: command exited with code {returncode}")
+        return False
+    return True
+
+def run_pip(args):
+    """Run pip in a subprocess with the persistent build cache"""
+    # pip does not support being called in-process, and requirements.txt upgrades pip itself
+    return run_command([sys.executable, '-m', 'pip'] + args,
+                       env=dict(os.environ, PIP_CACHE_DIR=PIP_CACHE_DIR))
+
+def run_pyinstaller(args):
+    """Run PyInstaller inside the current interpreter and return whether it succeeded"""
+    log.debug("Running: pyinstaller %s", args)
+    try:
+        import PyInstaller.__main__
+        PyInstaller.__main__.run(args)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            print(f"Error: PyInstaller exited with code {e.code}")
+            return False
+    except Exception as e:
+        print(f"Error: {e}")
+        return False
+    return True
+
+def discard_directory(path):
+    """Move a directory out of the way and delete it in a background thread"""
+    trash = f"{path}.trash.{os.getpid()}"
+    os.replace(path, trash)
+    cleanup = threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True})
+    cleanup.start()
+    # Make sure the deletion finishes before the interpreter exits
+    atexit.register(cleanup.join)
+    return cleanup
+
+def file_sha256(path):
+    """Return the sha256 hex digest of a file"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def tree_sha256(root):
+    """Return a sha256 hex digest over all file paths and contents below root"""
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            digest.update(os.path.relpath(path, root).encode('utf-8'))
+            digest.update(file_sha256(path).encode('ascii'))
+    return digest.hexdigest()
+
+def package_archive():
+    """Zip the onedir output, but only when its content changed since the last archive"""
+    tree_hash = tree_sha256(APP_DIR)
+    archive = APP_DIR + '.zip'
+    try:
+        with open(ARCHIVE_MARKER, 'r') as f:
+            unchanged = f.read().strip() == tree_hash
+    except OSError:
+        unchanged = False
+    if unchanged and os.path.exists(archive):
+        print(f"Archive up to date: {os.path.abspath(archive)}")
+        return archive
+    shutil.make_archive(APP_DIR, 'zip', 'dist', APP_NAME)
+    with open(ARCHIVE_MARKER, 'w') as f:
+        f.write(tree_hash)
+    print(f"Archive created: {os.path.abspath(archive)}")
+    return archive
+
+def scan_project():
+    """Read the project directory once; maps entry names to os.DirEntry objects"""
+    return {entry.name: entry for entry in os.scandir('.')}
+
+def requirements_file(entries=None):
+    """Return the requirements file to install from, preferring the lock file"""
+    if entries is None:
+        entries = scan_project()
+    return REQUIREMENTS_LOCK if REQUIREMENTS_LOCK in entries else 'requirements.txt'
+
+def requirements_changed(requirements_hash):
+    """Check whether the requirements differ from the last successful install"""
+    try:
+        with open(REQUIREMENTS_MARKER, 'r') as f:
+            return f.read().strip() != requirements_hash
+    except OSError:
+        return True
+
+def version_numbers(version):
+    """Return the four numeric version fields, e.g. '1.7.0-rc1' -> (1, 7, 0, 0)"""
+    # Each part contributes its leading digits; parts without any count as 0
+    numbers = []
+    for part in version.split('.')[:4]:
+        match = re.match(r'\d+', part)
+        numbers.append(int(match.group()) if match else 0)
+    return tuple((numbers + [0, 0, 0, 0])[:4])
+
+def write_version_file():
+    """Generate the exe version resource; rewritten only when its content changes"""
+    with open('VERSION', 'r') as f:
+        version = f.read().strip()
+    numbers = version_numbers(version)
+    content = f"""VSVersionInfo(
+  ffi=FixedFileInfo(
+    filevers={numbers},
+    prodvers={numbers},
+    mask=0x3f,
+    flags=0x0,
+    OS=0x40004,
+    fileType=0x1,
+    subtype=0x0,
+    date=(0, 0)
+  ),
+  kids=[
+    StringFileInfo([
+      StringTable('040904B0', [
+        StringStruct('FileDescription', '{APP_NAME}'),
+        StringStruct('FileVersion', '{version}'),
+        StringStruct('ProductName', '{APP_NAME}'),
+        StringStruct('ProductVersion', '{version}')
+      ])
+    ]),
+    VarFileInfo([VarStruct('Translation', [1033, 1200])])
+  ]
+)
+"""
+    try:
+        with open(VERSION_FILE, 'r') as f:
+            if f.read() == content:
+                return
+    except OSError:
+        pass
+    os.makedirs('build', exist_ok=True)
+    with open(VERSION_FILE, 'w') as f:
+        f.write(content)
+
+def pin_input_timestamps():
+    """Make timestamp-sensitive build inputs deterministic"""
+    os.environ['SOURCE_DATE_EPOCH'] = SOURCE_DATE_EPOCH
+    # A git checkout resets the icon mtime; pin it so it never invalidates the cache.
+    # icon.ico is tracked, so its mtime is only rewritten when an epoch was given explicitly
+    if SOURCE_DATE_EPOCH_EXPLICIT and os.path.exists('icon.ico'):
+        epoch = int(SOURCE_DATE_EPOCH)
+        os.utime('icon.ico', (epoch, epoch))
+
+def build_manifest(args, entries):
+    """Describe the current build inputs: file hashes plus PyInstaller arguments"""
+    return {
+        'inputs': {p: file_sha256(p) for p in BUILD_INPUTS if p in entries},
+        'args': args,
+        'release': bool(os.environ.get('BUILD_RELEASE')),
+    }
+
+def build_up_to_date(manifest):
+    """Check whether the last successful build used exactly these inputs"""
+    if not os.path.exists(APP_EXE):
+        return False
+    try:
+        with open(BUILD_MANIFEST, 'r') as f:
+            return json.load(f) == manifest
+    except (OSError, ValueError):
         return False
-    print(f"Output: {result.stdout}")
+
+def install_dependencies(requirements, use_wheelhouse=False):
+    """Install a requirements file unless it is unchanged since the last successful install"""
+    requirements_hash = file_sha256(requirements)
+    if not requirements_changed(requirements_hash):
+        print("Dependencies up to date, skipping pip install")
+        return True
+    
+    print(f"Installing dependencies from {requirements}...")
+    pip_args = [
+        'install',
+        '--cache-dir', PIP_CACHE_DIR,
+        '--prefer-binary',
+    ]
+    if requirements == REQUIREMENTS_LOCK:
+        # Every transitive dependency is pinned, so skip the resolver entirely
+        pip_args += ['--no-deps', '--require-hashes']
+    if use_wheelhouse:
+        pip_args += ['--no-index', '--find-links', os.path.abspath(WHEELHOUSE)]
+    pip_args += ['-r', requirements]
+    if not run_pip(pip_args):
+        return False
+    os.makedirs('build', exist_ok=True)
+    with open(REQUIREMENTS_MARKER, 'w') as f:
+        f.write(requirements_hash)
     return True
 
-def build_executable():
+def bootstrap_wheelhouse():
+    """Download or build wheels for all requirements into the local wheelhouse"""
+    print(f"Populating {WHEELHOUSE}...")
+    return run_pip([
+        'wheel',
+        '--cache-dir', PIP_CACHE_DIR,
+        '--prefer-binary',
+        '--wheel-dir', WHEELHOUSE,
+        '-r', requirements_file()
+    ])
+
+def build_executable(fresh=False):
     """Build the Windows executable"""
     print("Building Windows executable...")
     
-    # Clean previous builds
-    if os.path.exists('dist'):
-        shutil.rmtree('dist')
-    if os.path.exists('build'):
-        shutil.rmtree('build')
+    # All analysis options (hidden imports, data files, icon) live in the spec file
+    cmd = ['--noconfirm', '--workpath', PYI_WORK_DIR, SPEC_FILE]
+    
+    # Nothing to do if no input changed since the last successful build
+    entries = scan_project()
+    manifest = build_manifest(cmd, entries)
+    if not fresh and build_up_to_date(manifest):
+        print(f"Build up to date: {os.path.abspath(APP_EXE)}")
+        return True
     
-    # Install dependencies
-    print("Installing dependencies...")
-    if not run_command([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt']):
+    # Keep build/ so PyInstaller can reuse its analysis cache;
+    # only remove previous output when a fresh build is requested.
+    # The actual deletion runs in the background during the install below.
+    if fresh and 'dist' in entries:
+        discard_directory('dist')
+    
+    wheelhouse = entries.get(WHEELHOUSE)
+    use_wheelhouse = wheelhouse is not None and wheelhouse.is_dir()
+    if not install_dependencies(requirements_file(entries), use_wheelhouse):
         return False
     
     # Build using PyInstaller
     print("Building with PyInstaller...")
-    cmd = [
-        'pyinstaller',
-        '--onefile',
-        '--windowed',
-        '--name=PAS Wireless Device Exporter',
-        '--add-data=main.py;.',
-        '--hidden-import=pymodbus',
-        '--hidden-import=pymodbus.client',
-        '--hidden-import=openpyxl',
-        '--hidden-import=tkinter',
-        '--hidden-import=tkinter.filedialog',
-        '--hidden-import=tkinter.messagebox',
-        'main.py'
-    ]
-    
-    # Add icon if it exists
-    if os.path.exists('icon.ico'):
-        cmd.extend(['--icon=icon.ico'])
-    
-    if not run_command(cmd):
+    # Must be set before PyInstaller is imported
+    os.environ['PYINSTALLER_CONFIG_DIR'] = PYI_CONFIG_DIR
+    pin_input_timestamps()
+    write_version_file()
+    if not run_pyinstaller(cmd):
         return False
     
     print("Build completed successfully!")
-    print(f"Executable created: {os.path.abspath('dist/PAS Wireless Device Exporter.exe')}")
+    print(f"Executable created: {os.path.abspath(APP_EXE)}")
+    package_archive()
+    
+    os.makedirs('build', exist_ok=True)
+    with open(BUILD_MANIFEST, 'w') as f:
+        json.dump(manifest, f, indent=2)
     return True
 
 if __name__ == "__main__":
-    if build_executable():
+    parser = argparse.ArgumentParser(description="Build the Windows executable")
+    parser.add_argument('--fresh', action='store_true',
+                        help="remove dist/ and rebuild even if no input changed")
+    parser.add_argument('--wheelhouse', action='store_true',
+                        help=f"populate {WHEELHOUSE}/ for offline installs before building")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="show the commands being run")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(message)s')
+    
+    if args.wheelhouse and not bootstrap_wheelhouse():
+        print("Build failed!")
+        sys.exit(1)
+    if build_executable(fresh=args.fresh):
         print("Build successful!")
     else:
         print("Build failed!")
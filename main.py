@@ -6,20 +6,25 @@ Exports Modbus device data to CSV or Excel format
 
 import tkinter as tk
 from tkinter import messagebox, filedialog, ttk
+import tkinter.font as tkfont
 import threading
 import time
 import csv
 import os
 from datetime import datetime
 import struct
+import socket
 import json
+import random
 import weakref
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import hashlib
 from functools import lru_cache
+from operator import itemgetter
 import asyncio
 import concurrent.futures
 import gc
+import inspect
 import logging
 import traceback
 from typing import Optional, Dict, Any, List
@@ -51,6 +56,29 @@ except ImportError:
     except ImportError:
         MODBUS_AVAILABLE = False
 
+# Keyword that selects the target device; it was renamed unit -> slave (3.x) -> device_id (3.10+).
+# Detected once here so read_registers does not need a try/except TypeError per call.
+_DEVICE_ID_KW = 'slave'
+if MODBUS_AVAILABLE:
+    try:
+        _read_params = inspect.signature(ModbusClient.read_holding_registers).parameters
+        _DEVICE_ID_KW = next((kw for kw in ('device_id', 'slave') if kw in _read_params), 'unit')
+    except (TypeError, ValueError):
+        pass
+
+# Async client lets collect_data keep several requests in flight; sync path is the fallback
+try:
+    from pymodbus.client import AsyncModbusTcpClient
+    ASYNC_MODBUS_AVAILABLE = True
+except ImportError:
+    ASYNC_MODBUS_AVAILABLE = False
+
+# Timeout (seconds) of the plain TCP probe done before a connection test
+CONNECT_PREFLIGHT_TIMEOUT = 1.5
+
+# Write buffer for CSV exports
+CSV_BUFFER_SIZE = 1024 * 1024
+
 # Try to import openpyxl for Excel export
 try:
     import openpyxl
@@ -58,12 +86,131 @@ try:
 except ImportError:
     EXCEL_AVAILABLE = False
 
+# Cell fills for the Signal Quality and RSSI columns of Excel exports
+if EXCEL_AVAILABLE:
+    from openpyxl.styles import PatternFill
+    from openpyxl.formatting.rule import CellIsRule, FormulaRule
+    from openpyxl.utils import get_column_letter
+    
+    def _solid_fill(color):
+        return PatternFill(start_color=color, end_color=color, fill_type="solid")
+    
+    SIGNAL_QUALITY_FILLS = {
+        "Excellent": _solid_fill("00FF00"),  # Green
+        "Good": _solid_fill("90EE90"),       # Light Green
+        "Fair": _solid_fill("FFFF00"),       # Yellow
+        "Weak": _solid_fill("FF6600"),       # Orange
+        "Very Weak": _solid_fill("FF0000"),  # Red
+        "Unknown": _solid_fill("CCCCCC"),    # Gray
+    }
+    SIGNAL_QUALITY_FILLS[""] = SIGNAL_QUALITY_FILLS["Unknown"]
+    
+    RSSI_GOOD_FILL = _solid_fill("00FF00")     # Green (0 to -65 dBm)
+    RSSI_AVERAGE_FILL = _solid_fill("FFFF00")  # Yellow (-65 to -75 dBm)
+    RSSI_POOR_FILL = _solid_fill("FF0000")     # Red (< -75 dBm)
+    RSSI_UNKNOWN_FILL = _solid_fill("CCCCCC")  # Gray (Unknown/NaN)
+
+# Device identity columns that lead every export row
+EXPORT_BASE_FIELDS = ("DeviceID", "DeviceType", "RFID", "SerialNumber", "DeviceName", "DeviceLabel")
+
+# Order of the common diagnostic fields in exports
+EXPORT_COMMON_FIELDS = (
+    "Battery Voltage", "RF Communication Validity", "Communication Status",
+    "Gateway PER", "RSSI", "LQI", "PER Max", "RSSI Min", "LQI Min", "Signal Quality"
+)
+
+# Device-specific diagnostic fields, exported after the common ones
+EXPORT_DEVICE_SPECIFIC_FIELDS = {
+    "HeatTag": ("HeatTag Alarm Type", "HeatTag Alarm Level", "HeatTag Operation Mode")
+}
+
+@lru_cache(maxsize=None)
+def export_fields(device_type):
+    """Return the ordered export fields for a device type and the same fields as a frozenset"""
+    fields = EXPORT_COMMON_FIELDS + EXPORT_DEVICE_SPECIFIC_FIELDS.get(device_type, ())
+    return fields, frozenset(fields)
+
+# Sensor attributes read from the pairing JSON, in sheet column order
+SENSOR_PAIRING_JSON_KEYS = (
+    'slaveId', 'deviceAddress', 'Equipement', 'SensorPosition', 'MeasuredPoint',
+    'CubicleId', 'CubicleType', 'FeederId', 'CircuitBreakerId', 'DrawerId'
+)
+_EMPTY_DEFAULTS = ('',) * len(SENSOR_PAIRING_JSON_KEYS)
+
+# Device columns filled in from the Modbus data, and their value when no device matches
+SENSOR_PAIRING_DEVICE_KEYS = ('SerialNumber', 'DeviceType', 'DeviceName', 'DeviceLabel')
+_DEVICE_NOT_FOUND = ('Not Found',) * len(SENSOR_PAIRING_DEVICE_KEYS)
+
+# Minimum Excel column width (characters); fits RFIDs, serial numbers and decoded values
+EXPORT_MIN_COLUMN_WIDTH = 14
+
+def write_export_sheet(ws, headers, rows):
+    """Append the header and data rows to a write-only sheet, colouring Signal Quality and RSSI"""
+    # Write-only sheets take column widths only before the first row; size them from the
+    # headers, which are known up front, instead of measuring the streamed rows
+    for col_idx, header in enumerate(headers, start=1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = max(len(header) + 2, EXPORT_MIN_COLUMN_WIDTH)
+    ws.append(headers)
+    last_row = 1
+    for last_row, row in enumerate(rows, start=2):
+        ws.append(row)
+    if last_row == 1:
+        return
+    
+    # Colours are conditional formatting rules that Excel evaluates on open:
+    # a fixed handful of rules per column instead of a styled cell per row
+    if "Signal Quality" in headers:
+        col = get_column_letter(headers.index("Signal Quality") + 1)
+        cell_range = f"{col}2:{col}{last_row}"
+        for quality, fill in SIGNAL_QUALITY_FILLS.items():
+            if quality:
+                rule = CellIsRule(operator='equal', formula=[f'"{quality}"'], fill=fill)
+            else:
+                rule = FormulaRule(formula=[f'LEN(TRIM({col}2))=0'], fill=fill)
+            ws.conditional_formatting.add(cell_range, rule)
+    
+    if "RSSI" in headers:
+        col = get_column_letter(headers.index("RSSI") + 1)
+        cell_range = f"{col}2:{col}{last_row}"
+        top = f"{col}2"
+        for formula, fill in (
+            (f'AND(ISNUMBER({top}),{top}>=-65)', RSSI_GOOD_FILL),
+            (f'AND(ISNUMBER({top}),{top}<-65,{top}>=-75)', RSSI_AVERAGE_FILL),
+            (f'AND(ISNUMBER({top}),{top}<-75)', RSSI_POOR_FILL),
+            (f'NOT(ISNUMBER({top}))', RSSI_UNKNOWN_FILL),  # NaN, empty or invalid values
+        ):
+            ws.conditional_formatting.add(cell_range, FormulaRule(formula=[formula], fill=fill))
+
+def configure_socket(client):
+    """Disable Nagle's algorithm and enable keep-alive on a connected client's socket
+    
+    Modbus frames are tiny; with Nagle enabled each request can be held back
+    for up to ~40 ms waiting to be coalesced (see the Modbus Messaging
+    Implementation Guide, section 4.3.2).
+    """
+    sock = getattr(client, 'socket', None)
+    if sock is None:
+        transport = getattr(client, 'transport', None) or getattr(getattr(client, 'ctx', None), 'transport', None)
+        sock = getattr(transport, 'socket', None)
+        # asyncio transports (async client) expose the socket via get_extra_info
+        if sock is None and hasattr(transport, 'get_extra_info'):
+            sock = transport.get_extra_info('socket')
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not configure Modbus socket: {e}")
+
 # Connection Pool Manager
 class ConnectionPool:
     def __init__(self, max_connections=5):
         self.pool = {}
         self.max_connections = max_connections
         self.lock = threading.Lock()
+        # pymodbus clients are not thread-safe; export and live diagnostics share them
+        self.client_locks = {}
     
     def get_connection(self, ip, port=502):
         """Get a connection from the pool or create a new one"""
@@ -82,12 +229,18 @@ class ConnectionPool:
             if len(self.pool) < self.max_connections:
                 client = ModbusClient(ip, port=port)
                 if client.connect():
+                    configure_socket(client)
                     # Store IP for caching purposes
                     client._cached_ip = ip
                     self.pool[key] = client
                     return client
             return None
     
+    def client_lock(self, ip, port=502):
+        """Get the lock serializing use of the pooled connection for ip:port"""
+        with self.lock:
+            return self.client_locks.setdefault(f"{ip}:{port}", threading.Lock())
+    
     def close_all(self):
         """Close all connections in the pool"""
         with self.lock:
@@ -138,9 +291,42 @@ class DataCache:
         with self.lock:
             self.cache.clear()
 
+# Identity registers of a device (name, serial number, RFID, ...) do not change while it
+# stays paired, so they are kept in memory for the session until explicitly cleared.
+# Nothing is persisted: another gateway on the same IP or a re-paired slot would
+# otherwise be exported with a previous device's identity.
+class IdentityCache:
+    def __init__(self):
+        self.cache = {}
+        self.lock = threading.Lock()
+    
+    def _generate_key(self, ip, device_id):
+        """Generate cache key"""
+        return f"{ip}:{device_id}"
+    
+    def get(self, ip, device_id, names):
+        """Get the cached identity registers if every requested field is present"""
+        with self.lock:
+            identity = self.cache.get(self._generate_key(ip, device_id))
+            if identity and all(name in identity for name in names):
+                return identity
+            return None
+    
+    def set(self, ip, device_id, identity):
+        """Cache identity registers; partial reads are not cached"""
+        if all(identity.values()):
+            with self.lock:
+                self.cache[self._generate_key(ip, device_id)] = dict(identity)
+    
+    def clear(self):
+        """Clear all cached identities"""
+        with self.lock:
+            self.cache.clear()
+
 # Global instances
 connection_pool = ConnectionPool()
 data_cache = DataCache()
+identity_cache = IdentityCache()
 
 # Memory management utilities
 class MemoryManager:
@@ -229,13 +415,18 @@ class AsyncOperationManager:
 async_manager = AsyncOperationManager()
 
 # Optimized decode functions with caching
+@lru_cache(maxsize=None)
+def register_struct(count):
+    """Return a precompiled big-endian struct for count 16-bit registers"""
+    return struct.Struct(f'>{count}H')
+
 @lru_cache(maxsize=1000)
 def decode_ascii_tuple(registers_tuple):
     """Cached ASCII decode function for tuple input"""
-    registers = list(registers_tuple)
-    return "".join(
-        chr((reg >> 8) & 0xFF) + chr(reg & 0xFF) for reg in registers
-    ).split("\x00")[0].strip()
+    # latin-1 maps every byte to the same code point as chr() did; strip after decoding
+    # so non-ASCII whitespace (\xa0, \x85) is still removed as before
+    buf = register_struct(len(registers_tuple)).pack(*registers_tuple)
+    return buf.partition(b"\x00")[0].decode('latin-1').strip()
 
 # Wrapper for tuple conversion
 def decode_ascii_cached(registers):
@@ -244,33 +435,63 @@ def decode_ascii_cached(registers):
         return decode_ascii_tuple(tuple(registers))
     return ""
 
+# Prebuilt structs so decode_float32 does not parse format strings per call
+_U32_PACK = struct.Struct('!I').pack
+_F32_UNPACK = struct.Struct('!f').unpack
+
 def decode_float32(registers):
     """Decode Float32 value from two Modbus registers."""
     if registers and len(registers) == 2:
-        combined = (registers[0] << 16) | registers[1]
-        return struct.unpack('!f', struct.pack('!I', combined))[0]
+        return _F32_UNPACK(_U32_PACK((registers[0] << 16) | registers[1]))[0]
     return None
 
+@lru_cache(maxsize=None)
+def float32_struct(count):
+    """Return a precompiled big-endian struct for count Float32 values"""
+    return struct.Struct(f'>{count}f')
+
+def decode_float32_batch(register_pairs):
+    """Decode a list of two-register Float32 values in a single unpack"""
+    words = [reg for pair in register_pairs for reg in pair]
+    return float32_struct(len(register_pairs)).unpack(register_struct(len(words)).pack(*words))
+
 # Optimized read_registers function with caching
-def read_registers(client, device_id, address, count, log_widget=None):
-    # Check cache first
+def read_registers(client, device_id, address, count, log_widget=None, use_cache=True):
+    # Check cache first; live readings pass use_cache=False to always hit the device
+    ip = getattr(client, '_cached_ip', 'unknown')
+    if use_cache:
+        cached_data = data_cache.get(ip, device_id, address, count)
+        if cached_data is not None:
+            return cached_data
+    
+    try:
+        result = client.read_holding_registers(address, count=count, **{_DEVICE_ID_KW: device_id})
+        
+        if result.isError():
+            raise Exception(f"Modbus-Fehler: {result}")
+        
+        # Cache the result
+        if use_cache:
+            data_cache.set(ip, device_id, address, count, result.registers)
+        return result.registers
+    except Exception as e:
+        if log_widget:
+            log_widget.log_message(f"⚠ Fehler beim Lesen der Register {address}: {e}")
+        return None
+
+async def read_registers_async(client, device_id, address, count, log_widget=None):
+    """Async counterpart of read_registers for AsyncModbusTcpClient"""
     ip = getattr(client, '_cached_ip', 'unknown')
     cached_data = data_cache.get(ip, device_id, address, count)
     if cached_data is not None:
         return cached_data
     
     try:
-        # Try newer parameter style first
-        try:
-            result = client.read_holding_registers(address, count=count, slave=device_id)
-        except TypeError:
-            # Fall back to older parameter style
-            result = client.read_holding_registers(address, count, unit=device_id)
+        result = await client.read_holding_registers(address, count=count, **{_DEVICE_ID_KW: device_id})
         
         if result.isError():
             raise Exception(f"Modbus-Fehler: {result}")
         
-        # Cache the result
         data_cache.set(ip, device_id, address, count, result.registers)
         return result.registers
     except Exception as e:
@@ -278,6 +499,78 @@ def read_registers(client, device_id, address, count, log_widget=None):
             log_widget.log_message(f"⚠ Fehler beim Lesen der Register {address}: {e}")
         return None
 
+# Maximum number of holding registers in a single read request (Modbus FC03 limit)
+MAX_REGISTERS_PER_READ = 125
+
+def group_register_fields(fields):
+    """Group (name, address, count) fields into spans that fit a single read request"""
+    groups = []
+    for name, address, count in sorted(fields, key=lambda field: field[1]):
+        group = groups[-1] if groups else None
+        if group and address + count - group[0][1] <= MAX_REGISTERS_PER_READ:
+            group.append((name, address, count))
+        else:
+            groups.append([(name, address, count)])
+    return groups
+
+def group_span(group):
+    """Return (start, count) of the registers covered by a field group"""
+    start = group[0][1]
+    end = max(address + count for _, address, count in group)
+    return start, end - start
+
+def read_register_fields(client, device_id, fields, log_widget=None, use_cache=True):
+    """Read several register fields with as few Modbus requests as possible
+    
+    fields is an iterable of (name, address, count). Fields lying within
+    MAX_REGISTERS_PER_READ registers of each other are fetched with a single
+    read and sliced locally; if such a combined read fails, each field of the
+    group is read on its own. Returns a dict mapping name -> registers or None.
+    """
+    fields_by_name = {}
+    for group in group_register_fields(fields):
+        start, count = group_span(group)
+        block = None
+        if len(group) > 1:
+            block = read_registers(client, device_id, start, count, log_widget, use_cache)
+        if block and len(block) >= count:
+            for name, address, field_count in group:
+                fields_by_name[name] = block[address - start:address - start + field_count]
+        else:
+            for name, address, field_count in group:
+                fields_by_name[name] = read_registers(client, device_id, address, field_count, log_widget, use_cache)
+    return fields_by_name
+
+async def read_register_fields_async(client, device_id, fields, log_widget=None):
+    """Async counterpart of read_register_fields; all groups are requested concurrently"""
+    groups = group_register_fields(fields)
+    
+    async def read_group(group):
+        start, count = group_span(group)
+        block = None
+        if len(group) > 1:
+            block = await read_registers_async(client, device_id, start, count, log_widget)
+        if block and len(block) >= count:
+            return {name: block[address - start:address - start + field_count]
+                    for name, address, field_count in group}
+        regs = await asyncio.gather(*(
+            read_registers_async(client, device_id, address, field_count, log_widget)
+            for _, address, field_count in group
+        ))
+        return {name: field_regs for (name, _, _), field_regs in zip(group, regs)}
+    
+    fields_by_name = {}
+    for group_fields in await asyncio.gather(*(read_group(group) for group in groups)):
+        fields_by_name.update(group_fields)
+    return fields_by_name
+
+# Signal quality matrix indexed by [PER bucket][LQI bucket], see get_signal_quality
+_SQ_TABLE = (
+    ("Weak", "Weak", "Fair"),        # PER > 30%
+    ("Weak", "Fair", "Good"),        # 10% < PER <= 30%
+    ("Fair", "Good", "Excellent"),   # PER <= 10%
+)
+
 def get_signal_quality(lqi, per):
     """Calculate signal quality level based on LQI and PER values
     Based on Schneider Electric EcoStruxure Panel Server documentation
@@ -296,36 +589,44 @@ def get_signal_quality(lqi, per):
         lqi_value = float(lqi)
         per_value = float(per)
         
-        # Handle NaN values
-        if str(lqi_value).lower() == 'nan' or str(per_value).lower() == 'nan':
+        # Handle NaN values (NaN is the only float not equal to itself)
+        if lqi_value != lqi_value or per_value != per_value:
             return "Unknown"
         
         # Apply the signal quality matrix
-        if per_value > 30:
-            if lqi_value < 30:
-                return "Weak"
-            elif lqi_value < 60:
-                return "Weak"
-            else:  # lqi_value >= 60
-                return "Fair"
-        elif per_value > 10:
-            if lqi_value < 30:
-                return "Weak"
-            elif lqi_value < 60:
-                return "Fair"
-            else:  # lqi_value >= 60
-                return "Good"
-        else:  # per_value <= 10
-            if lqi_value < 30:
-                return "Fair"
-            elif lqi_value < 60:
-                return "Good"
-            else:  # lqi_value >= 60
-                return "Excellent"
+        per_index = 0 if per_value > 30 else 1 if per_value > 10 else 2
+        lqi_index = 0 if lqi_value < 30 else 1 if lqi_value < 60 else 2
+        return _SQ_TABLE[per_index][lqi_index]
                 
     except (ValueError, TypeError):
         return "Unknown"
 
+# HeatTag alarm type by register value 0..190; 99 is the test alarm inside the high range
+_HEATTAG_ALARM_TYPES = tuple(
+    "No alarm" if val == 0
+    else "Low level alarm" if val <= 15
+    else "Medium level alarm" if val <= 93
+    else "Test alarm" if val == 99
+    else "High level alarm"
+    for val in range(191)
+)
+
+# Register value -> text for the small enumerated diagnostics fields
+_HEATTAG_ALARM_LEVELS = {
+    0: "No alarm",
+    1: "Low level alarm",
+    2: "Medium level alarm",
+    3: "High level alarm",
+}
+_HEATTAG_OPERATION_MODES = {
+    0: "Test mode (0-30 min after power on)",
+    1: "Auto-learning mode (30 min-8 hrs after power on)",
+    2: "Normal operation mode (>8 hrs after power on)",
+}
+_COMMUNICATION_STATUSES = {0: "Com. loss", 1: "OK"}
+_RF_COMMUNICATION_VALIDITY = {0: "Invalid", 1: "Valid"}
+
+@lru_cache(maxsize=256)
 def decode_heattag_alarm_type(value):
     """Decode HeatTag alarm type value to human-readable string"""
     if value is None or value == "N/A":
@@ -333,21 +634,13 @@ def decode_heattag_alarm_type(value):
     
     try:
         val = int(value)
-        if val == 0:
-            return "No alarm"
-        elif 1 <= val <= 15:
-            return "Low level alarm"
-        elif 16 <= val <= 93:
-            return "Medium level alarm"
-        elif val == 99:
-            return "Test alarm"
-        elif 94 <= val <= 190:
-            return "High level alarm"
-        else:
-            return f"Unknown ({val})"
+        if 0 <= val < len(_HEATTAG_ALARM_TYPES):
+            return _HEATTAG_ALARM_TYPES[val]
+        return f"Unknown ({val})"
     except (ValueError, TypeError):
         return f"Invalid ({value})"
 
+@lru_cache(maxsize=256)
 def decode_heattag_alarm_level(value):
     """Decode HeatTag alarm level value to human-readable string"""
     if value is None or value == "N/A":
@@ -355,19 +648,11 @@ def decode_heattag_alarm_level(value):
     
     try:
         val = int(value)
-        if val == 0:
-            return "No alarm"
-        elif val == 1:
-            return "Low level alarm"
-        elif val == 2:
-            return "Medium level alarm"
-        elif val == 3:
-            return "High level alarm"
-        else:
-            return f"Unknown ({val})"
+        return _HEATTAG_ALARM_LEVELS.get(val, f"Unknown ({val})")
     except (ValueError, TypeError):
         return f"Invalid ({value})"
 
+@lru_cache(maxsize=256)
 def decode_heattag_operation_mode(value):
     """Decode HeatTag operation mode value to human-readable string"""
     if value is None or value == "N/A":
@@ -375,17 +660,11 @@ def decode_heattag_operation_mode(value):
     
     try:
         val = int(value)
-        if val == 0:
-            return "Test mode (0-30 min after power on)"
-        elif val == 1:
-            return "Auto-learning mode (30 min-8 hrs after power on)"
-        elif val == 2:
-            return "Normal operation mode (>8 hrs after power on)"
-        else:
-            return f"Unknown ({val})"
+        return _HEATTAG_OPERATION_MODES.get(val, f"Unknown ({val})")
     except (ValueError, TypeError):
         return f"Invalid ({value})"
 
+@lru_cache(maxsize=256)
 def decode_communication_status(value):
     """Decode Communication Status value to human-readable string"""
     if value is None or value == "N/A":
@@ -393,15 +672,11 @@ def decode_communication_status(value):
     
     try:
         val = int(value)
-        if val == 0:
-            return "Com. loss"
-        elif val == 1:
-            return "OK"
-        else:
-            return f"Unknown ({val})"
+        return _COMMUNICATION_STATUSES.get(val, f"Unknown ({val})")
     except (ValueError, TypeError):
         return f"Invalid ({value})"
 
+@lru_cache(maxsize=256)
 def decode_rf_communication_validity(value):
     """Decode RF Communication Validity value to human-readable string"""
     if value is None or value == "N/A":
@@ -409,56 +684,94 @@ def decode_rf_communication_validity(value):
     
     try:
         val = int(value)
-        if val == 0:
-            return "Invalid"
-        elif val == 1:
-            return "Valid"
-        else:
-            return f"Unknown ({val})"
+        return _RF_COMMUNICATION_VALIDITY.get(val, f"Unknown ({val})")
     except (ValueError, TypeError):
         return f"Invalid ({value})"
 
-def read_enhanced_diagnostics(client, device_id, device_type, log_widget=None):
+# Decoders applied to diagnostic values when exporting
+EXPORT_DECODERS = {
+    "Communication Status": decode_communication_status,
+    "RF Communication Validity": decode_rf_communication_validity,
+    "HeatTag Alarm Type": decode_heattag_alarm_type,
+    "HeatTag Alarm Level": decode_heattag_alarm_level,
+    "HeatTag Operation Mode": decode_heattag_operation_mode,
+}
+
+# Diagnostics register types; index into _DIAGNOSTICS_DECODERS
+_F32, _U16, _BMP = 0, 1, 2
+
+# Common diagnostics registers (address, count, name, type) for all device types
+_ENHANCED_COMMON = (
+    (31144, 1, "RF Communication Validity", _BMP),
+    (31145, 1, "Communication Status", _BMP),
+    (31151, 2, "Gateway PER", _F32),
+    (31153, 2, "RSSI", _F32),
+    (31155, 1, "LQI", _U16),
+    (31156, 2, "PER Max", _F32),
+    (31158, 2, "RSSI Min", _F32),
+    (31160, 1, "LQI Min", _U16),
+)
+
+# Device-specific registers are appended to the common set
+_ENHANCED_REGISTERS = {
+    "CL110": _ENHANCED_COMMON + (
+        (3315, 2, "Battery Voltage", _F32),
+    ),
+    # HeatTag specific registers - only for HeatTag devices
+    "HeatTag": _ENHANCED_COMMON + (
+        (3321, 1, "HeatTag Alarm Type", _U16),
+        (3322, 1, "HeatTag Alarm Level", _U16),
+        (31175, 1, "HeatTag Operation Mode", _U16),
+    ),
+}
+
+# The same registers as (name, address, count) fields for read_register_fields
+_ENHANCED_READ_FIELDS = {
+    registers: tuple((field_name, addr, count) for addr, count, field_name, _ in registers)
+    for registers in (_ENHANCED_COMMON, *_ENHANCED_REGISTERS.values())
+}
+
+_DIAGNOSTICS_DECODERS = (
+    lambda regs: round(decode_float32(regs), 2),  # _F32
+    lambda regs: regs[0],                         # _U16
+    lambda regs: regs[0],                         # _BMP
+)
+
+def enhanced_register_map(device_type):
+    """Return the (address, count, name, type) diagnostics registers for a device type"""
+    return _ENHANCED_REGISTERS.get(device_type, _ENHANCED_COMMON)
+
+def enhanced_read_fields(device_type):
+    """Return the diagnostics registers of a device type as (name, address, count) fields"""
+    return _ENHANCED_READ_FIELDS[enhanced_register_map(device_type)]
+
+def read_enhanced_diagnostics(client, device_id, device_type, log_widget=None, use_cache=True):
     """Read enhanced diagnostics for TH110, CL110, and HeatTag devices"""
+    # Contiguous diagnostics registers are fetched with one request
+    registers = read_register_fields(client, device_id, enhanced_read_fields(device_type), log_widget, use_cache)
+    return decode_enhanced_diagnostics(enhanced_register_map(device_type), registers, log_widget)
+
+def decode_enhanced_diagnostics(enhanced_registers, registers, log_widget=None):
+    """Decode raw diagnostics registers (name -> registers) into display values"""
     diagnostics = {}
-    # Define common registers for all device types
-    enhanced_registers = [
-        (31144, 1, "RF Communication Validity", "BITMAP"),
-        (31145, 1, "Communication Status", "BITMAP"),
-        (31151, 2, "Gateway PER", "Float32"),
-        (31153, 2, "RSSI", "Float32"),
-        (31155, 1, "LQI", "UINT16"),
-        (31156, 2, "PER Max", "Float32"),
-        (31158, 2, "RSSI Min", "Float32"),
-        (31160, 1, "LQI Min", "UINT16")
+    # All Float32 fields are decoded together with one pack/unpack pass
+    float_fields = [
+        field_name for _, _, field_name, field_type in enhanced_registers
+        if field_type == _F32 and registers[field_name] and len(registers[field_name]) == 2
     ]
-    
-    # Add device-specific registers
-    if device_type == "CL110":
-        enhanced_registers.append((3315, 2, "Battery Voltage", "Float32"))
-    elif device_type == "HeatTag":
-        # HeatTag specific registers - only for HeatTag devices
-        enhanced_registers.extend([
-            (3321, 1, "HeatTag Alarm Type", "UINT16"),
-            (3322, 1, "HeatTag Alarm Level", "UINT16"),
-            (31175, 1, "HeatTag Operation Mode", "UINT16")
-        ])
+    float_values = dict(zip(float_fields, decode_float32_batch([registers[name] for name in float_fields])))
     
     for addr, count, field_name, field_type in enhanced_registers:
-        regs = read_registers(client, device_id, addr, count, log_widget)
+        regs = registers[field_name]
         if regs:
-            value = None
-            if field_type == "Float32":
-                value = round(decode_float32(regs), 2)
-            elif field_type == "UINT16":
-                value = regs[0] if regs else None
-            elif field_type == "BITMAP":
-                value = regs[0] if regs else None
-            # Add more type handlers if needed
+            if field_name in float_values:
+                value = round(float_values[field_name], 2)
+            else:
+                value = _DIAGNOSTICS_DECODERS[field_type](regs)
             
             diagnostics[field_name] = value
             if log_widget:
-                log_widget.log_message(f"  ✓ {field_name}: {value}")
+                log_widget.log_message(f"  ✓ {field_name}: {value}", verbose=True)
         else:
             diagnostics[field_name] = "N/A"
             if log_widget:
@@ -470,151 +783,475 @@ def read_enhanced_diagnostics(client, device_id, device_type, log_widget=None):
     signal_quality = get_signal_quality(lqi_value, per_value)
     diagnostics["Signal Quality"] = signal_quality
     if log_widget:
-        log_widget.log_message(f"  ✓ Signal Quality: {signal_quality}")
+        log_widget.log_message(f"  ✓ Signal Quality: {signal_quality}", verbose=True)
     
     return diagnostics
 
-# Original get_device_ids function
-def get_device_ids(client, log_widget=None):
-    base = 504
-    step = 5
-    max_devices = 100
-    device_ids = []
+# Commercial Reference → device type
+_REF_TO_TYPE = {
+    "EMS59443": "CL110",
+    "EMS59440": "TH110",
+    "SMT10020": "HeatTag",
+}
+
+# Device types that expose the enhanced diagnostics registers
+_ENHANCED_TYPES = frozenset(("TH110", "CL110", "HeatTag"))
+
+# Device identity registers (name, address, count), read together per device
+IDENTITY_FIELDS = (
+    ("DeviceName", 31000, 10),
+    ("DeviceLabel", 31010, 3),
+    ("RFID", 31026, 6),
+    ("CommercialReference", 31060, 16),
+    ("SerialNumber", 31088, 10),
+)
 
-    if log_widget:
-        log_widget.log_message("→ Suche DeviceIDs in alternativen Registern (504, 509, 514, ...)")
+# Product Model is only logged for debugging and never exported; read it only with MODBUS_DEBUG=1
+DEBUG_PRODUCT_MODEL = os.environ.get('MODBUS_DEBUG') == '1'
+if DEBUG_PRODUCT_MODEL:
+    IDENTITY_FIELDS += (("ProductModel", 31106, 8),)
+
+IDENTITY_FIELD_NAMES = tuple(name for name, _, _ in IDENTITY_FIELDS)
+
+def read_identity(client, device_id, log_widget=None):
+    """Read the identity registers of a device, served from identity_cache once known"""
+    ip = getattr(client, '_cached_ip', 'unknown')
+    identity = identity_cache.get(ip, device_id, IDENTITY_FIELD_NAMES)
+    if identity is not None:
+        if log_widget:
+            log_widget.log_message(f"  ✓ Identität von Device {device_id} aus Sitzungs-Cache")
+        return identity
+    
+    # Identity registers 31000..31097 (..31113 with ProductModel) are read in one request and sliced per field
+    identity = read_register_fields(client, device_id, IDENTITY_FIELDS, log_widget)
+    identity_cache.set(ip, device_id, identity)
+    return identity
+
+async def read_identity_async(client, device_id, log_widget=None):
+    """Async counterpart of read_identity"""
+    ip = getattr(client, '_cached_ip', 'unknown')
+    identity = identity_cache.get(ip, device_id, IDENTITY_FIELD_NAMES)
+    if identity is not None:
+        if log_widget:
+            log_widget.log_message(f"  ✓ Identität von Device {device_id} aus Sitzungs-Cache")
+        return identity
     
-    for i in range(max_devices):
-        addr = base + (i * step)
-        result = read_registers(client, 255, addr, 1, log_widget)
-        if result and result[0] not in (0, 0xFFFF):
-            device_id = result[0]
+    identity = await read_register_fields_async(client, device_id, IDENTITY_FIELDS, log_widget)
+    identity_cache.set(ip, device_id, identity)
+    return identity
+
+# Gateway DeviceID table: one slot every DEVICE_ID_STEP registers from DEVICE_ID_BASE
+DEVICE_ID_BASE = 504
+DEVICE_ID_STEP = 5
+MAX_DEVICES = 100
+DEVICE_ID_END = DEVICE_ID_BASE + (MAX_DEVICES - 1) * DEVICE_ID_STEP + 1
+
+def device_id_blocks():
+    """Split the DeviceID table into (start, count) spans that fit a single read request"""
+    # MAX_REGISTERS_PER_READ is a multiple of DEVICE_ID_STEP, so every block starts on a slot
+    return [
+        (start, min(MAX_REGISTERS_PER_READ, DEVICE_ID_END - start))
+        for start in range(DEVICE_ID_BASE, DEVICE_ID_END, MAX_REGISTERS_PER_READ)
+    ]
+
+def device_ids_from_slots(slot_values, log_widget=None):
+    """Pick the valid DeviceIDs out of a slot address -> register value mapping"""
+    device_ids = []
+    for addr in range(DEVICE_ID_BASE, DEVICE_ID_END, DEVICE_ID_STEP):
+        value = slot_values.get(addr)
+        if value is not None and value not in (0, 0xFFFF):
             if log_widget:
-                log_widget.log_message(f"✓ Reg {addr}: DeviceID {device_id}")
-            device_ids.append(device_id)
+                log_widget.log_message(f"✓ Reg {addr}: DeviceID {value}")
+            device_ids.append(value)
         else:
             if log_widget:
-                log_widget.log_message(f"- Kein gültiger DeviceID-Wert in Register {addr}")
+                log_widget.log_message(f"- Kein gültiger DeviceID-Wert in Register {addr}", verbose=True)
     return device_ids
 
+def get_device_ids(client, log_widget=None):
+    """Read the DeviceID table with a few block reads instead of one request per slot"""
+    if log_widget:
+        log_widget.log_message("→ Suche DeviceIDs in alternativen Registern (504, 509, 514, ...)")
+    
+    slot_values = {}
+    for start, count in device_id_blocks():
+        regs = read_registers(client, 255, start, count, log_widget)
+        if regs and len(regs) >= count:
+            for addr in range(start, start + count, DEVICE_ID_STEP):
+                slot_values[addr] = regs[addr - start]
+        else:
+            # Block read rejected (e.g. gaps in the register map); probe the slots one by one
+            for addr in range(start, start + count, DEVICE_ID_STEP):
+                result = read_registers(client, 255, addr, 1, log_widget)
+                slot_values[addr] = result[0] if result else None
+    return device_ids_from_slots(slot_values, log_widget)
+
+def format_rfid(rfid_regs):
+    """Format the RFID registers as the first 8 hex digits of the non-zero registers"""
+    # 4 hex digits per register, so that is the first two non-zero registers, packed and hexed in C
+    nonzero = [reg for reg in rfid_regs if reg > 0][:2]
+    return register_struct(len(nonzero)).pack(*nonzero).hex().upper()
+
+def parse_identity(device_id, identity, log_widget=None):
+    """Build the device record from the identity registers read for a device"""
+    log_fn = log_widget.log_message if log_widget else None
+    device_data = {
+        "DeviceID": device_id,
+        "DeviceType": "",
+        "RFID": "",
+        "SerialNumber": "",
+    }
+    
+    # Commercial Reference → 31060
+    ref_regs = identity["CommercialReference"]
+    ref = decode_ascii_cached(ref_regs) if ref_regs else ""
+    if log_fn:
+        log_fn(f"→ Device {device_id} hat Commercial Reference: {ref}")
+
+    device_type = _REF_TO_TYPE.get(ref, "Unknown")
+    device_data["DeviceType"] = device_type
+
+    # RFID → 31026 (6 Register, hex)
+    rfid_regs = identity["RFID"]
+    if rfid_regs:
+        if log_fn:
+            log_fn(f"  📦 RFID (Reg 31026, 6): {rfid_regs}", verbose=True)
+        device_data["RFID"] = format_rfid(rfid_regs)
+    else:
+        if log_fn:
+            log_fn("  ⚠ RFID: Fehler beim Lesen")
+
+    # Serial Number → 31088 (10 Register, ASCII)
+    sn_regs = identity["SerialNumber"]
+    if sn_regs:
+        sn = decode_ascii_cached(sn_regs)
+        if log_fn:
+            log_fn(f"  📦 SerialNumber (Reg 31088, 10): {sn_regs}", verbose=True)
+            log_fn(f"  ✓ SerialNumber: {sn}", verbose=True)
+        device_data["SerialNumber"] = sn
+    else:
+        if log_fn:
+            log_fn("  ⚠ SerialNumber: Fehler beim Lesen")
+    
+    # Device Name → 31000 (10 Register, ASCII)
+    device_name_regs = identity["DeviceName"]
+    if device_name_regs:
+        device_name = decode_ascii_cached(device_name_regs)
+        if log_fn:
+            log_fn(f"  📦 DeviceName (Reg 31000, 10): {device_name_regs}", verbose=True)
+            log_fn(f"  ✓ DeviceName: {device_name}", verbose=True)
+        device_data["DeviceName"] = device_name
+    else:
+        if log_fn:
+            log_fn("  ⚠ DeviceName: Fehler beim Lesen")
+        device_data["DeviceName"] = ""
+    
+    # Device Label → 31010 (3 Register, ASCII)
+    device_label_regs = identity["DeviceLabel"]
+    if device_label_regs:
+        device_label = decode_ascii_cached(device_label_regs)
+        if log_fn:
+            log_fn(f"  📦 DeviceLabel (Reg 31010, 3): {device_label_regs}", verbose=True)
+            log_fn(f"  ✓ DeviceLabel: {device_label}", verbose=True)
+        device_data["DeviceLabel"] = device_label
+    else:
+        if log_fn:
+            log_fn("  ⚠ DeviceLabel: Fehler beim Lesen")
+        device_data["DeviceLabel"] = ""
+    return device_data
+
+def log_product_model(identity, log_widget=None):
+    """Log the decoded product model of a device"""
+    log_fn = log_widget.log_message if log_widget else None
+    # Product Model (nur Debug) → 31106
+    pm_regs = identity.get("ProductModel")
+    if pm_regs:
+        pm = decode_ascii_cached(pm_regs)
+        if log_fn:
+            log_fn(f"  📦 ProductModel (Reg 31106, 8): {pm_regs}", verbose=True)
+            log_fn(f"  ✓ ProductModel: {pm}", verbose=True)
+
+def parallel_workers(log_widget):
+    """Read the number of parallel gateway connections/requests; Tk thread only"""
+    try:
+        return max(1, int(log_widget.max_workers_var.get()))
+    except (AttributeError, ValueError, tk.TclError):
+        return 1
+
 # Optimized collect_data function with connection pooling
-def collect_data(ip, log_widget=None):
+def collect_data(ip, log_widget=None, enhanced_enabled=False, max_workers=1):
+    # The pooled client stays open for the next export or live diagnostics cycle
+    with connection_pool.client_lock(ip):
+        return collect_pooled_data(ip, log_widget, enhanced_enabled, max_workers)
+
+def collect_pooled_data(ip, log_widget=None, enhanced_enabled=False, max_workers=1):
+    """Body of collect_data; the caller must hold the connection's client lock"""
+    log_fn = log_widget.log_message if log_widget else None
     # Use connection pool
     client = connection_pool.get_connection(ip)
     if not client:
-        if log_widget:
-            log_widget.log_message("❌ Verbindung fehlgeschlagen.")
+        if log_fn:
+            log_fn("❌ Verbindung fehlgeschlagen.")
         return None
 
-    if log_widget:
-        log_widget.log_message("✓ Verbindung erfolgreich hergestellt.")
+    if log_fn:
+        log_fn("✓ Verbindung erfolgreich hergestellt.")
     
     device_ids = get_device_ids(client, log_widget)
     if not device_ids:
-        if log_widget:
-            log_widget.log_message("⚠ Keine gültigen DeviceIDs gefunden.")
-        client.close()
+        if log_fn:
+            log_fn("⚠ Keine gültigen DeviceIDs gefunden.")
         return None
 
-    data = []
-    for idx, device_id in enumerate(device_ids, start=1):
-        if log_widget:
-            log_widget.log_message(f"[{idx}/{len(device_ids)}] Verarbeite Device ID {device_id}")
-        
-        device_data = {
-            "DeviceID": device_id,
-            "DeviceType": "",
-            "RFID": "",
-            "SerialNumber": "",
-        }
+    # Only requested when the async client is unavailable, see _export_data
+    if max_workers > 1 and len(device_ids) > 1:
+        return collect_devices_parallel(ip, device_ids, enhanced_enabled, max_workers, log_widget)
+    
+    return [
+        collect_device(client, idx, device_id, len(device_ids), enhanced_enabled, log_widget)
+        for idx, device_id in enumerate(device_ids, start=1)
+    ]
 
-        # Commercial Reference → 31060
-        ref_regs = read_registers(client, device_id, 31060, 16, log_widget)
-        ref = decode_ascii_cached(ref_regs) if ref_regs else ""
-        if log_widget:
-            log_widget.log_message(f"→ Device {device_id} hat Commercial Reference: {ref}")
-
-        device_type = ""
-        if ref == "EMS59443":
-            device_type = "CL110"
-        elif ref == "EMS59440":
-            device_type = "TH110"
-        elif ref == "SMT10020":
-            device_type = "HeatTag"
-        else:
-            device_type = "Unknown"
-        device_data["DeviceType"] = device_type
+def collect_device(client, idx, device_id, total, enhanced_enabled, log_widget=None):
+    """Read and decode the identity (and optionally diagnostics) of one device"""
+    log_fn = log_widget.log_message if log_widget else None
+    if log_fn:
+        log_fn(f"[{idx}/{total}] Verarbeite Device ID {device_id}")
+    
+    identity = read_identity(client, device_id, log_widget)
+    device_data = parse_identity(device_id, identity, log_widget)
+    device_type = device_data["DeviceType"]
+
+    # Enhanced Diagnostics if enabled
+    if enhanced_enabled and device_type in _ENHANCED_TYPES:
+        enhanced_diagnostics = read_enhanced_diagnostics(client, device_id, device_type, log_widget)
+        device_data["EnhancedDiagnostics"] = enhanced_diagnostics
+        if log_fn:
+            log_fn(f"→ Enhanced Diagnostics for {device_type}: {enhanced_diagnostics}")
+    else:
+        device_data["EnhancedDiagnostics"] = {}
+
+    log_product_model(identity, log_widget)
+    return device_data
+
+class ClientWorkerPool:
+    """Thread pool whose worker threads each keep a private Modbus connection open
+    
+    pymodbus clients are not thread-safe, so every worker thread opens its own
+    client (kept in a threading.local) instead of sharing the pooled one. The
+    connections stay open between map() calls until close().
+    """
+    def __init__(self, ip, max_workers, port=502):
+        self.ip = ip
+        self.port = port
+        self.max_workers = max_workers
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self.thread_state = threading.local()
+        self.clients = []
+        self.lock = threading.Lock()
+    
+    def _client(self):
+        """Return this worker thread's client, reconnecting it if the connection dropped"""
+        client = getattr(self.thread_state, 'client', None)
+        if client is None:
+            client = ModbusClient(self.ip, port=self.port)
+            # Store IP for caching purposes
+            client._cached_ip = self.ip
+            self.thread_state.client = client
+            with self.lock:
+                self.clients.append(client)
+        elif client.is_socket_open():
+            return client
+        if client.connect():
+            configure_socket(client)
+        return client
+    
+    def map(self, fn, items):
+        """Call fn(client, item) for every item; results are returned in item order"""
+        return list(self.executor.map(lambda item: fn(self._client(), item), items))
+    
+    def close(self):
+        """Stop the worker threads and close their connections"""
+        self.executor.shutdown(wait=True)
+        with self.lock:
+            for client in self.clients:
+                client.close()
+            self.clients.clear()
 
-        # RFID → 31026 (6 Register, hex)
-        rfid_regs = read_registers(client, device_id, 31026, 6, log_widget)
-        if rfid_regs:
-            if log_widget:
-                log_widget.log_message(f"  📦 RFID (Reg 31026, 6): {rfid_regs}")
-            hex_str = "".join(f"{reg:04X}" for reg in rfid_regs if reg > 0)
-            device_data["RFID"] = hex_str[:8]
-        else:
-            if log_widget:
-                log_widget.log_message("  ⚠ RFID: Fehler beim Lesen")
+def map_with_clients(ip, fn, items, max_workers, port=502):
+    """Call fn(client, item) for every item on several threads, each with its own Modbus connection"""
+    pool = ClientWorkerPool(ip, max_workers, port)
+    try:
+        return pool.map(fn, items)
+    finally:
+        pool.close()
+
+def collect_devices_parallel(ip, device_ids, enhanced_enabled, max_workers, log_widget=None, port=502):
+    """Process devices on several threads, each with its own Modbus connection"""
+    def collect(client, item):
+        idx, device_id = item
+        return collect_device(client, idx, device_id, len(device_ids), enhanced_enabled, log_widget)
+    
+    return map_with_clients(ip, collect, list(enumerate(device_ids, start=1)), max_workers, port)
 
-        # Serial Number → 31088 (10 Register, ASCII)
-        sn_regs = read_registers(client, device_id, 31088, 10, log_widget)
-        if sn_regs:
-            sn = decode_ascii_cached(sn_regs)
-            if log_widget:
-                log_widget.log_message(f"  📦 SerialNumber (Reg 31088, 10): {sn_regs}")
-                log_widget.log_message(f"  ✓ SerialNumber: {sn}")
-            device_data["SerialNumber"] = sn
-        else:
-            if log_widget:
-                log_widget.log_message("  ⚠ SerialNumber: Fehler beim Lesen")
+def collect_live_device(client, device_id):
+    """Read the identity and current diagnostics shown in the live diagnostics table"""
+    # Identity registers are only read from the device the first time it is seen
+    identity = read_identity(client, device_id)
+    
+    # Get device type first
+    ref_regs = identity["CommercialReference"]
+    ref = decode_ascii_cached(ref_regs) if ref_regs else ""
+    
+    device_type = _REF_TO_TYPE.get(ref, "Unknown")
+    
+    # Get device name
+    device_name_regs = identity["DeviceName"]
+    device_name = decode_ascii_cached(device_name_regs) if device_name_regs else "Unknown"
+    
+    # Get RFID
+    rfid_regs = identity["RFID"]
+    rfid = format_rfid(rfid_regs) if rfid_regs else ""
+    
+    # Get Serial Number
+    sn_regs = identity["SerialNumber"]
+    serial_number = decode_ascii_cached(sn_regs) if sn_regs else "Unknown"
+    
+    # Get enhanced diagnostics; bypass the register cache so every poll is current
+    diagnostics = read_enhanced_diagnostics(client, device_id, device_type, use_cache=False)
+    
+    return {
+        "DeviceID": device_id,
+        "DeviceType": device_type,
+        "DeviceName": device_name,
+        "RFID": rfid,
+        "SerialNumber": serial_number,
+        "Diagnostics": diagnostics
+    }
+
+async def get_device_ids_async(client, log_widget=None):
+    """Async counterpart of get_device_ids; all DeviceID blocks are requested concurrently"""
+    if log_widget:
+        log_widget.log_message("→ Suche DeviceIDs in alternativen Registern (504, 509, 514, ...)")
+    
+    async def read_block(start, count):
+        regs = await read_registers_async(client, 255, start, count, log_widget)
+        addresses = range(start, start + count, DEVICE_ID_STEP)
+        if regs and len(regs) >= count:
+            return {addr: regs[addr - start] for addr in addresses}
+        # Block read rejected; probe the slots one by one
+        results = await asyncio.gather(*(
+            read_registers_async(client, 255, addr, 1, log_widget) for addr in addresses
+        ))
+        return {addr: result[0] if result else None for addr, result in zip(addresses, results)}
+    
+    slot_values = {}
+    for block in await asyncio.gather(*(read_block(start, count) for start, count in device_id_blocks())):
+        slot_values.update(block)
+    return device_ids_from_slots(slot_values, log_widget)
+
+async def collect_data_async(ip, log_widget=None, enhanced_enabled=False, max_workers=1, port=502):
+    """Collect device data like collect_data, with the reads of several devices in flight at once"""
+    log_fn = log_widget.log_message if log_widget else None
+    client = AsyncModbusTcpClient(ip, port=port)
+    
+    # Bound the number of devices in flight so small gateways are not flooded
+    device_slots = asyncio.Semaphore(max_workers)
+    
+    async def process_device(idx, device_id):
+        async with device_slots:
+            return await read_device(idx, device_id)
+    
+    async def read_device(idx, device_id):
+        if log_fn:
+            log_fn(f"[{idx}/{len(device_ids)}] Verarbeite Device ID {device_id}")
         
-        # Device Name → 31000 (10 Register, ASCII)
-        device_name_regs = read_registers(client, device_id, 31000, 10, log_widget)
-        if device_name_regs:
-            device_name = decode_ascii_cached(device_name_regs)
-            if log_widget:
-                log_widget.log_message(f"  📦 DeviceName (Reg 31000, 10): {device_name_regs}")
-                log_widget.log_message(f"  ✓ DeviceName: {device_name}")
-            device_data["DeviceName"] = device_name
-        else:
-            if log_widget:
-                log_widget.log_message("  ⚠ DeviceName: Fehler beim Lesen")
-            device_data["DeviceName"] = ""
+        identity = await read_identity_async(client, device_id, log_widget)
+        device_data = parse_identity(device_id, identity, log_widget)
+        device_type = device_data["DeviceType"]
         
-        # Device Label → 31010 (3 Register, ASCII)
-        device_label_regs = read_registers(client, device_id, 31010, 3, log_widget)
-        if device_label_regs:
-            device_label = decode_ascii_cached(device_label_regs)
-            if log_widget:
-                log_widget.log_message(f"  📦 DeviceLabel (Reg 31010, 3): {device_label_regs}")
-                log_widget.log_message(f"  ✓ DeviceLabel: {device_label}")
-            device_data["DeviceLabel"] = device_label
-        else:
-            if log_widget:
-                log_widget.log_message("  ⚠ DeviceLabel: Fehler beim Lesen")
-            device_data["DeviceLabel"] = ""
-
         # Enhanced Diagnostics if enabled
-        if hasattr(log_widget, 'enhanced_diagnostics_var') and log_widget.enhanced_diagnostics_var.get() and device_type in ["TH110", "CL110", "HeatTag"]:
-            enhanced_diagnostics = read_enhanced_diagnostics(client, device_id, device_type, log_widget)
+        if enhanced_enabled and device_type in _ENHANCED_TYPES:
+            registers = await read_register_fields_async(
+                client, device_id, enhanced_read_fields(device_type), log_widget
+            )
+            enhanced_diagnostics = decode_enhanced_diagnostics(
+                enhanced_register_map(device_type), registers, log_widget
+            )
             device_data["EnhancedDiagnostics"] = enhanced_diagnostics
-            if log_widget:
-                log_widget.log_message(f"→ Enhanced Diagnostics for {device_type}: {enhanced_diagnostics}")
+            if log_fn:
+                log_fn(f"→ Enhanced Diagnostics for {device_type}: {enhanced_diagnostics}")
         else:
             device_data["EnhancedDiagnostics"] = {}
+        
+        log_product_model(identity, log_widget)
+        return device_data
+    
+    try:
+        await client.connect()
+        if not client.connected:
+            if log_fn:
+                log_fn("❌ Verbindung fehlgeschlagen.")
+            return None
+        
+        # Store IP for caching purposes
+        client._cached_ip = ip
+        configure_socket(client)
+        if log_fn:
+            log_fn("✓ Verbindung erfolgreich hergestellt.")
+        
+        device_ids = await get_device_ids_async(client, log_widget)
+        if not device_ids:
+            if log_fn:
+                log_fn("⚠ Keine gültigen DeviceIDs gefunden.")
+            return None
+        
+        # gather keeps the results in device order
+        return list(await asyncio.gather(*(
+            process_device(idx, device_id) for idx, device_id in enumerate(device_ids, start=1)
+        )))
+    finally:
+        client.close()
 
-        # Product Model (nur Debug) → 31106
-        pm_regs = read_registers(client, device_id, 31106, 8, log_widget)
-        if pm_regs:
-            pm = decode_ascii_cached(pm_regs)
-            if log_widget:
-                log_widget.log_message(f"  📦 ProductModel (Reg 31106, 8): {pm_regs}")
-                log_widget.log_message(f"  ✓ ProductModel: {pm}")
-
-        data.append(device_data)
-
-    client.close()
-    return data
+# Device and diagnostics fields shown in the live table, with their placeholders when missing
+LIVE_DEVICE_KEYS = ("DeviceID", "DeviceType", "DeviceName", "RFID", "SerialNumber")
+_UNKNOWN_DEFAULTS = ("Unknown",) * len(LIVE_DEVICE_KEYS)
+LIVE_DIAGNOSTIC_KEYS = (
+    "RF Communication Validity", "Communication Status", "Signal Quality",
+    "RSSI", "LQI", "Gateway PER", "Battery Voltage"
+)
+_NA_DEFAULTS = ("N/A",) * len(LIVE_DIAGNOSTIC_KEYS)
+
+# Row colour tag per signal quality; anything else is drawn 'normal'
+LIVE_ROW_TAGS = {
+    "Excellent": 'excellent',
+    "Good": 'good',
+    "Fair": 'fair',
+    "Weak": 'poor',
+}
+
+# Signal quality levels drawn by the live diagnostics simulation
+SIMULATED_SIGNAL_QUALITIES = ("Good", "Fair", "Excellent")
+
+# Live table column sizing: padding added to the widest measured text, and (min, max) width per column
+LIVE_COLUMN_PADDING = 30
+LIVE_COLUMN_LIMITS = {
+    "DeviceID": (60, 120),
+    "DeviceType": (110, 110),  # Fixed width for "HeatTag" (7 chars)
+    "RFID": (120, 120),  # Fixed width for 8 chars (increased)
+    "SerialNumber": (120, 180),
+    "DeviceName": (120, 300),
+    "RFCommunication": (80, 140),
+    "CommStatus": (100, 180),
+    "SignalQuality": (100, 150),
+    "RSSI": (80, 140),
+    "LQI": (60, 100),
+    "GatewayPER": (80, 140),
+    "Battery": (80, 140),
+}
+LIVE_DEFAULT_COLUMN_LIMITS = (60, 200)
+# Columns that are never auto-resized
+LIVE_FIXED_WIDTH_COLUMNS = frozenset(("DeviceType", "RFID"))
 
 class ModbusExporterGUI:
     def __init__(self, root):
@@ -642,10 +1279,23 @@ class ModbusExporterGUI:
         self.excel_var = tk.BooleanVar(value=EXCEL_AVAILABLE)
         self.enhanced_diagnostics_var = tk.BooleanVar(value=False)
         self.sensor_pairing_var = tk.BooleanVar(value=False)
+        self.max_workers_var = tk.IntVar(value=4)
+        # Per-register detail lines are only logged in verbose mode; the flag is mirrored
+        # into a plain attribute so worker threads don't have to query Tcl per message
+        self.verbose_log_var = tk.BooleanVar(value=False)
+        self.verbose_logging = False
+        self.verbose_log_var.trace_add('write', lambda *args: setattr(self, 'verbose_logging', self.verbose_log_var.get()))
+        # Log lines (str) and status changes ((message, color) tuples) are queued by any
+        # thread and applied on the Tk thread in batches; deque append/popleft are atomic
+        self.log_queue = deque()
+        # Persistent pool for short Modbus I/O jobs such as connection tests
+        self.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="modbus-io")
         
         # Live diagnostics variables
         self.live_diagnostics_enabled = False
         self.live_diagnostics_thread = None
+        # Set to wake the live diagnostics worker out of its wait between polls
+        self.live_stop_event = threading.Event()
         self.live_data_tree_columns = ["DeviceID", "DeviceType", "RFID", "SerialNumber", "DeviceName", "RFCommunication", "CommStatus", "SignalQuality", "RSSI", "LQI", "GatewayPER", "Battery"]
         self.last_connection_test = False
         self.last_live_update = "Never"
@@ -656,6 +1306,19 @@ class ModbusExporterGUI:
         self.column_visibility = {}
         for col in self.optional_columns:
             self.column_visibility[col] = tk.BooleanVar(value=True)
+        # Snapshot of the displayed columns; rows always carry values for every column
+        self.visible_columns = tuple(self.live_data_tree_columns)
+        # Tree items of the live table and the (values, tag) last rendered into each,
+        # so a refresh only touches rows that changed
+        self.live_row_items = []
+        self.live_rows = []
+        # Poll result behind the current rows; an identical poll skips the refresh entirely
+        self.live_data_snapshot = None
+        # Set while a deferred column width pass is scheduled
+        self.refresh_pending = False
+        # Width last applied to each live table column and the (static) width of its heading
+        self.live_column_widths = {}
+        self.live_heading_widths = {}
         
         # Setup GUI
         self.setup_gui()
@@ -813,7 +1476,33 @@ class ModbusExporterGUI:
                                          variable=self.sensor_pairing_var, font=("Helvetica Neue", 11),
                                          bg='#44475a', fg='#f8f8f2', activeforeground='#50fa7b',
                                          activebackground='#44475a', selectcolor='#6272a4')
-        sensor_pairing_cb.pack(pady=(5, 15), padx=15, anchor='w')
+        sensor_pairing_cb.pack(pady=(5, 5), padx=15, anchor='w')
+        
+        # Number of devices read in parallel
+        workers_frame = tk.Frame(export_frame, bg='#44475a')
+        workers_frame.pack(pady=5, padx=15, anchor='w')
+        workers_label = tk.Label(workers_frame, text="Parallel requests:",
+                                font=("Helvetica Neue", 11),
+                                bg='#44475a', fg='#f8f8f2')
+        workers_label.pack(side='left')
+        workers_spinbox = tk.Spinbox(workers_frame, from_=1, to=8, width=3,
+                                    textvariable=self.max_workers_var, font=("Helvetica Neue", 11),
+                                    bg='#6272a4', fg='#f8f8f2', buttonbackground='#44475a',
+                                    relief='flat', bd=0)
+        workers_spinbox.pack(side='left', padx=(10, 0))
+        
+        # Identity registers are cached for the session; re-read them after swapping devices
+        refresh_identity_btn = tk.Button(export_frame, text="Refresh Device Identities",
+                                        command=self.refresh_device_identities,
+                                        font=("Helvetica Neue", 11),
+                                        bg='#6272a4', fg='#2d2d2d',
+                                        relief='flat', bd=0,
+                                        activebackground='#8be9fd',
+                                        activeforeground='#2d2d2d',
+                                        highlightthickness=0)
+        refresh_identity_btn.pack(pady=(5, 15), padx=15, anchor='w')
+        self.create_tooltip(refresh_identity_btn,
+                            "Forget cached device names, serial numbers and RFIDs so the next export reads them again")
 
         # Control Buttons with modern design
         button_frame = tk.Frame(left_column, bg='#282a36')
@@ -987,6 +1676,11 @@ class ModbusExporterGUI:
         style.configure('Treeview.Heading', background='#6272a4', foreground='#f8f8f2', font=('Helvetica Neue', 11, 'bold'))
         style.map('Treeview', background=[('selected', '#bd93f9')], foreground=[('selected', '#282a36')])
         
+        # Pixel width of cell and heading text in the fonts above, for sizing columns;
+        # device names and values repeat between refreshes, so measurements are cached
+        self.measure_cell_text = lru_cache(maxsize=512)(tkfont.nametofont('TkDefaultFont').measure)
+        self.measure_heading_text = lru_cache(maxsize=512)(tkfont.Font(font=('Helvetica Neue', 11, 'bold')).measure)
+        
         # Configure tags for different value types
         self.live_data_tree.tag_configure('good', foreground='#4CAF50')
         self.live_data_tree.tag_configure('fair', foreground='#FF9800')
@@ -1001,6 +1695,7 @@ class ModbusExporterGUI:
         self.live_data_tree.configure(yscrollcommand=live_data_scrollbar.set)
         live_data_scrollbar.pack(side='right', fill='y')
         
+        self.root.after(100, self._flush_log)
         self.log_message("Application started. Ready to export Modbus data.")
         if not MODBUS_AVAILABLE:
             self.log_message("WARNING: pymodbus not installed. Using simulation mode.")
@@ -1065,6 +1760,12 @@ class ModbusExporterGUI:
                              activeforeground='#2d2d2d')
         clear_btn.pack(side='right')
         
+        verbose_cb = tk.Checkbutton(button_frame, text="Verbose (register details)",
+                                   variable=self.verbose_log_var, font=("Helvetica Neue", 11),
+                                   bg='#282a36', fg='#f8f8f2', activeforeground='#50fa7b',
+                                   activebackground='#282a36', selectcolor='#6272a4')
+        verbose_cb.pack(side='left')
+        
         # Handle window closing
         def on_log_window_close():
             self.log_window.destroy()
@@ -1084,25 +1785,51 @@ class ModbusExporterGUI:
         if self.log_text:
             self.log_text.delete(1.0, tk.END)
 
-    def log_message(self, message):
+    def log_message(self, message, verbose=False):
         """Add a timestamped message to the log"""
+        if verbose and not self.verbose_logging:
+            return
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
         
         # Print to console
         print(log_entry.strip())
         
-        # Add to GUI log if window exists
-        if self.log_text:
-            self.log_text.insert(tk.END, log_entry)
-            self.log_text.see(tk.END)
-            if self.log_window and self.log_window.winfo_exists():
-                self.log_window.update_idletasks()
-
+        # Queue for the GUI log; safe to call from worker threads
+        self.log_queue.append(log_entry)
+
+    def _flush_log(self):
+        """Apply queued status changes and write queued log lines with a single insert"""
+        if self.log_queue:
+            entries = []
+            status = None
+            while self.log_queue:
+                entry = self.log_queue.popleft()
+                if isinstance(entry, tuple):
+                    # Only the latest status of the batch is visible anyway
+                    status = entry
+                else:
+                    entries.append(entry)
+            if status:
+                self.status_label.config(text=status[0], fg=status[1])
+            # Add to GUI log if window exists
+            if entries and self.log_text:
+                self.log_text.insert(tk.END, "".join(entries))
+                self.log_text.see(tk.END)
+        self.root.after(100, self._flush_log)
+
+    def refresh_device_identities(self):
+        """Forget cached device identities so they are read from the devices again"""
+        identity_cache.clear()
+        self.log_message("✓ Gespeicherte Geräte-Identitäten verworfen")
+    
     def update_status(self, message, color='#4CAF50'):
         """Update the status label"""
-        self.status_label.config(text=message, fg=color)
-        self.root.update_idletasks()
+        if threading.current_thread() is threading.main_thread():
+            self.status_label.config(text=message, fg=color)
+        else:
+            # Worker threads must not touch widgets; queued for _flush_log like log lines
+            self.log_queue.append((message, color))
 
     def test_ip(self):
         """Test the IP address connectivity"""
@@ -1114,36 +1841,49 @@ class ModbusExporterGUI:
         self.log_message(f"Testing IP address: {ip}")
         self.update_status("Testing connection...", '#FF9800')
         
-        # Simulate connection test
-        threading.Thread(target=self._test_ip_thread, args=(ip,), daemon=True).start()
+        if not MODBUS_AVAILABLE:
+            # Simulate test; a timer on the Tk thread instead of a sleeping worker
+            self.root.after(2000, self._simulate_test_complete, ip)
+            return
+        
+        # Run the test on the shared I/O pool; the button state is updated back on the Tk thread
+        future = self.io_pool.submit(self._test_ip_thread, ip)
+        future.add_done_callback(lambda f: self.root.after(0, self.update_live_diagnostics_button))
 
     def _test_ip_thread(self, ip):
         """Test IP connection in a separate thread"""
         try:
-            if MODBUS_AVAILABLE:
-                client = ModbusClient(ip, port=502)
-                if client.connect():
-                    self.log_message(f"✓ Successfully connected to {ip}")
-                    self.update_status("Connection successful", '#4CAF50')
-                    self.last_connection_test = True
-                    client.close()
-                else:
-                    self.log_message(f"✗ Failed to connect to {ip}")
-                    self.update_status("Connection failed", '#f44336')
-                    self.last_connection_test = False
-            else:
-                # Simulate test
-                time.sleep(2)
-                self.log_message(f"✓ IP test completed for {ip} (simulation mode)")
-                self.update_status("Test completed (simulation)", '#4CAF50')
+            # Plain TCP probe first so unreachable hosts fail fast instead of
+            # waiting for the Modbus client's connect timeout
+            try:
+                socket.create_connection((ip, 502), timeout=CONNECT_PREFLIGHT_TIMEOUT).close()
+            except OSError:
+                self.log_message(f"✗ Failed to connect to {ip}")
+                self.update_status("Connection failed", '#f44336')
+                self.last_connection_test = False
+                return
+            
+            client = ModbusClient(ip, port=502)
+            if client.connect():
+                self.log_message(f"✓ Successfully connected to {ip}")
+                self.update_status("Connection successful", '#4CAF50')
                 self.last_connection_test = True
+                client.close()
+            else:
+                self.log_message(f"✗ Failed to connect to {ip}")
+                self.update_status("Connection failed", '#f44336')
+                self.last_connection_test = False
         except Exception as e:
             self.log_message(f"✗ Error testing IP {ip}: {str(e)}")
             self.update_status("Connection error", '#f44336')
             self.last_connection_test = False
-        finally:
-            # Update live diagnostics button state based on connection test result
-            self.update_live_diagnostics_button()
+
+    def _simulate_test_complete(self, ip):
+        """Finish a simulated connection test (no Modbus library installed)"""
+        self.log_message(f"✓ IP test completed for {ip} (simulation mode)")
+        self.update_status("Test completed (simulation)", '#4CAF50')
+        self.last_connection_test = True
+        self.update_live_diagnostics_button()
 
     def start_export(self):
         """Start the data export process"""
@@ -1155,7 +1895,9 @@ class ModbusExporterGUI:
             messagebox.showerror("Error", "Please enter an IP address")
             return
         
-        if not self.csv_var.get() and not self.excel_var.get():
+        # Read the export options once, on the main thread
+        options = self._export_options()
+        if not options['csv'] and not options['excel_selected']:
             messagebox.showerror("Error", "Please select at least one export format")
             return
         
@@ -1166,7 +1908,7 @@ class ModbusExporterGUI:
         self.update_status("Exporting data...", '#FF9800')
         
         # Start export in separate thread
-        self.export_thread = threading.Thread(target=self._export_data, args=(ip,), daemon=True)
+        self.export_thread = threading.Thread(target=self._export_data, args=(ip, options), daemon=True)
         self.export_thread.start()
 
     def stop_export(self):
@@ -1180,12 +1922,38 @@ class ModbusExporterGUI:
         self.log_message("Export stopped by user")
         self.update_status("Export stopped", '#FF9800')
 
-    def _export_data(self, ip):
+    def _export_options(self):
+        """Snapshot the export checkboxes as plain values"""
+        # Variable.get() is a Tcl round-trip and must not run on worker threads
+        excel_selected = bool(self.excel_var.get())
+        enhanced = bool(self.enhanced_diagnostics_var.get())
+        return {
+            'csv': bool(self.csv_var.get()),
+            'excel_selected': excel_selected,
+            'excel': excel_selected and EXCEL_AVAILABLE,
+            'suffix': "_ED" if enhanced else "",
+            'sensor_pairing': bool(self.sensor_pairing_var.get()),
+            'enhanced': enhanced,
+            'max_workers': parallel_workers(self),
+        }
+
+    def _export_data(self, ip, options=None):
         """Export data using the original collect_data function"""
+        if options is None:
+            options = self._export_options()
         try:
             if MODBUS_AVAILABLE:
-                # Use original collect_data function
-                data = collect_data(ip, self)
+                if options['max_workers'] == 1:
+                    # One device at a time over the pooled connection shared with live diagnostics
+                    data = collect_data(ip, self, options['enhanced'])
+                elif ASYNC_MODBUS_AVAILABLE:
+                    # Pipelined reads of several devices on a dedicated connection;
+                    # runs its own event loop in this worker thread
+                    data = asyncio.run(collect_data_async(ip, self, options['enhanced'], options['max_workers']))
+                else:
+                    # This pymodbus has no async client: fan the devices out over
+                    # worker threads instead, each with its own connection
+                    data = collect_data(ip, self, options['enhanced'], options['max_workers'])
                 if data:
                     self.log_message(f"Collected {len(data)} device records. Saving files...")
                     
@@ -1196,10 +1964,10 @@ class ModbusExporterGUI:
                         return
                     
                     # Check if sensor pairing sheet is requested
-                    if self.sensor_pairing_var.get():
+                    if options['sensor_pairing']:
                         self._generate_sensor_pairing_sheet(data, base_file)
                     # Always perform normal export if CSV/Excel is selected
-                    self._save_original_data_with_base(data, base_file)
+                    self._save_original_data_with_base(data, base_file, options)
                     
                     self.log_message("Export completed successfully!")
                     self.update_status("Export completed", '#4CAF50')
@@ -1222,11 +1990,10 @@ class ModbusExporterGUI:
                     }
                     data.append(device_data)
                     self.log_message(f"Simulated device {i+1}: {device_data}")
-                    time.sleep(1)
                 
                 if data and self.is_running:
                     self.log_message(f"Collected {len(data)} simulated device records. Saving files...")
-                    self._save_original_data(data)
+                    self._save_original_data(data, options)
                     self.log_message("Export completed successfully!")
                     self.update_status("Export completed", '#4CAF50')
         
@@ -1238,187 +2005,99 @@ class ModbusExporterGUI:
                 self.is_running = False
                 self.start_btn.config(state='normal')
 
-    def flatten_diagnostics(self, data):
-        """Flatten the enhanced diagnostics into individual fields for export"""
-        # Define the order of common diagnostic fields
-        common_fields = [
-            "Battery Voltage", "RF Communication Validity", "Communication Status", 
-            "Gateway PER", "RSSI", "LQI", "PER Max", "RSSI Min", "LQI Min", "Signal Quality"
-        ]
-        
-        # Define device-specific fields
-        device_specific_fields = {
-            "HeatTag": ["HeatTag Alarm Type", "HeatTag Alarm Level", "HeatTag Operation Mode"]
-        }
-        
-        # Collect all headers from all devices
-        all_headers = set()
-        flattened_data = []
-        
+    def export_headers(self, data):
+        """Return the export column order for the fields present in any device"""
+        # Cheap first pass: only collect which diagnostic fields occur at all
+        present = set()
+        for device in data:
+            diagnostics = device.get("EnhancedDiagnostics", {})
+            if diagnostics:
+                present |= diagnostics.keys() & export_fields(device.get("DeviceType", ""))[1]
+        
+        # Base fields first, then common fields, then device-specific fields in order
+        headers = list(EXPORT_BASE_FIELDS)
+        headers += [field for field in EXPORT_COMMON_FIELDS if field in present]
+        for fields in EXPORT_DEVICE_SPECIFIC_FIELDS.values():
+            headers += [field for field in fields if field in present]
+        return headers
+
+    def iter_export_rows(self, data, headers):
+        """Yield one export row tuple per device, decoding diagnostics on the fly"""
         for device in data:
             device_type = device.get("DeviceType", "")
-            flat_device = {
-                "DeviceID": device.get("DeviceID", ""),
-                "DeviceType": device_type,
-                "RFID": device.get("RFID", ""),
-                "SerialNumber": device.get("SerialNumber", ""),
-                "DeviceName": device.get("DeviceName", ""),
-                "DeviceLabel": device.get("DeviceLabel", "")
-            }
+            flat_device = {field: device.get(field, "") for field in EXPORT_BASE_FIELDS}
             
             diagnostics = device.get("EnhancedDiagnostics", {})
             
-            # Add common fields for all devices (if they exist)
-            for field in common_fields:
-                if field in diagnostics:
-                    value = diagnostics[field]
-                    # Apply decoders for better readability
-                    if field == "Communication Status":
-                        value = decode_communication_status(value)
-                    elif field == "RF Communication Validity":
-                        value = decode_rf_communication_validity(value)
-                    flat_device[field] = value
-                    all_headers.add(field)
-            
-            # Add device-specific fields only for the appropriate device types
-            for dev_type, fields in device_specific_fields.items():
-                if device_type == dev_type:
-                    for field in fields:
-                        if field in diagnostics:
-                            value = diagnostics[field]
-                            # Apply HeatTag decoders for better readability
-                            if device_type == "HeatTag":
-                                if field == "HeatTag Alarm Type":
-                                    value = decode_heattag_alarm_type(value)
-                                elif field == "HeatTag Alarm Level":
-                                    value = decode_heattag_alarm_level(value)
-                                elif field == "HeatTag Operation Mode":
-                                    value = decode_heattag_operation_mode(value)
-                            flat_device[field] = value
-                            all_headers.add(field)
+            # Common fields for all devices, then the fields specific to this device type;
+            # one C-level intersection instead of a membership test per field
+            fields, field_set = export_fields(device_type)
+            present = diagnostics.keys() & field_set
+            if present:
+                for field in fields:
+                    if field in present:
+                        value = diagnostics[field]
+                        # Apply decoders for better readability
+                        decoder = EXPORT_DECODERS.get(field)
+                        flat_device[field] = decoder(value) if decoder else value
             
-            flattened_data.append(flat_device)
-        
-        # Create ordered header list: common fields first, then device-specific fields
-        ordered_headers = []
-        for field in common_fields:
-            if field in all_headers:
-                ordered_headers.append(field)
-        
-        # Add device-specific fields in order
-        for dev_type, fields in device_specific_fields.items():
-            for field in fields:
-                if field in all_headers:
-                    ordered_headers.append(field)
-        
-        return ordered_headers, flattened_data
+            yield tuple(flat_device.get(h, "") for h in headers)
 
-    def _save_original_data(self, data):
+    def _save_original_data(self, data, options=None):
         """Save data in the original format"""
-        # Ask user for file location
-        base_file = filedialog.asksaveasfilename(
-            title="Save Export As",
-            defaultextension="",
-            filetypes=[("All Files", "*.*")]
-        )
+        if options is None:
+            options = self._export_options()
         
+        # Ask user for file location
+        base_file = self._get_base_filename()
         if not base_file:
             self.log_message("Export cancelled by user")
             return
         
-        # Save as CSV
-        if self.csv_var.get():
-            filename = base_file + ".csv"
-            header_extras, flattened_data = self.flatten_diagnostics(data)
-            fieldnames = ["DeviceID", "DeviceType", "RFID", "SerialNumber", "DeviceName", "DeviceLabel"] + header_extras
-            with open(filename, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for row in flattened_data:
-                    writer.writerow({k: row.get(k, "") for k in fieldnames})
-            self.log_message(f"✓ CSV-Datei gespeichert: {filename}")
-        
-        # Save as Excel
-        if self.excel_var.get() and EXCEL_AVAILABLE:
-            filename = base_file + ".xlsx"
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Modbus Export"
-            header_extras, flattened_data = self.flatten_diagnostics(data)
-            headers = ["DeviceID", "DeviceType", "RFID", "SerialNumber", "DeviceName", "DeviceLabel"] + header_extras
-            
-            # Add headers
-            ws.append(headers)
-            
-            # Add data rows
-            for row in flattened_data:
-                ws.append([row.get(h, "") for h in headers])
-            
-            # Apply conditional formatting for Signal Quality if present
-            if "Signal Quality" in headers:
-                signal_quality_col = headers.index("Signal Quality") + 1  # Excel columns are 1-indexed
-                signal_quality_col_letter = openpyxl.utils.get_column_letter(signal_quality_col)
-                
-                # Define color fills for different signal quality levels
-                from openpyxl.styles import PatternFill
-                excellent_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")  # Green
-                good_fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")      # Light Green
-                fair_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")      # Yellow
-                weak_fill = PatternFill(start_color="FF6600", end_color="FF6600", fill_type="solid")      # Orange
-                very_weak_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid") # Red
-                unknown_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")   # Gray
-                
-                # Apply formatting to each cell in the Signal Quality column
-                for row_num in range(2, len(flattened_data) + 2):  # Start from row 2 (after header)
-                    cell = ws[f"{signal_quality_col_letter}{row_num}"]
-                    signal_quality_value = str(cell.value).strip() if cell.value else ""
-                    
-                    if signal_quality_value == "Excellent":
-                        cell.fill = excellent_fill
-                    elif signal_quality_value == "Good":
-                        cell.fill = good_fill
-                    elif signal_quality_value == "Fair":
-                        cell.fill = fair_fill
-                    elif signal_quality_value == "Weak":
-                        cell.fill = weak_fill
-                    elif signal_quality_value == "Very Weak":
-                        cell.fill = very_weak_fill
-                    elif signal_quality_value == "Unknown" or signal_quality_value == "":
-                        cell.fill = unknown_fill
-            
-            # Apply conditional formatting for RSSI if present
-            if "RSSI" in headers:
-                rssi_col = headers.index("RSSI") + 1  # Excel columns are 1-indexed
-                rssi_col_letter = openpyxl.utils.get_column_letter(rssi_col)
-                
-                # Define color fills for different RSSI power levels
-                from openpyxl.styles import PatternFill
-                rssi_good_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")    # Green (0 to -65 dBm)
-                rssi_average_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid") # Yellow (-65 to -75 dBm)
-                rssi_poor_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")    # Red (< -75 dBm)
-                rssi_unknown_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid") # Gray (Unknown/NaN)
-                
-                # Apply formatting to each cell in the RSSI column
-                for row_num in range(2, len(flattened_data) + 2):  # Start from row 2 (after header)
-                    cell = ws[f"{rssi_col_letter}{row_num}"]
-                    rssi_value = str(cell.value).strip() if cell.value else ""
-                    
-                    try:
-                        if rssi_value and rssi_value.lower() != 'nan':
-                            rssi_float = float(rssi_value)
-                            if rssi_float >= -65:  # 0 to -65 dBm = Good
-                                cell.fill = rssi_good_fill
-                            elif rssi_float >= -75:  # -65 to -75 dBm = Average
-                                cell.fill = rssi_average_fill
-                            else:  # < -75 dBm = Poor
-                                cell.fill = rssi_poor_fill
-                        else:
-                            cell.fill = rssi_unknown_fill  # NaN or empty values
-                    except (ValueError, TypeError):
-                        cell.fill = rssi_unknown_fill  # Invalid values
-            
-            wb.save(filename)
-            self.log_message(f"✓ Excel-Datei gespeichert: {filename}")
+        self._do_export(data, base_file, options)
+
+    def _write_csv_export(self, filename, headers, data):
+        """Write the export rows to a CSV file"""
+        # Large buffer so the whole export goes out in a few write() calls
+        with open(filename, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows(self.iter_export_rows(data, headers))
+
+    def _write_excel_export(self, filename, headers, data):
+        """Write the export rows to a formatted Excel file"""
+        # Write-only workbooks stream rows to the file instead of keeping a cell tree
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Modbus Export")
+        write_export_sheet(ws, headers, self.iter_export_rows(data, headers))
+        wb.save(filename)
+
+    def _do_export(self, data, base_file, options, diagnostics_suffix=""):
+        """Write the selected CSV and/or Excel export, both at once when both are requested"""
+        base_with_suffix = base_file + diagnostics_suffix
+        
+        writers = []
+        if options['csv']:
+            writers.append((self._write_csv_export, base_with_suffix + ".csv", "✓ CSV-Datei gespeichert"))
+        if options['excel']:
+            # Check if the base filename already ends with .xlsx to avoid double extension
+            excel_file = base_with_suffix if base_with_suffix.endswith('.xlsx') else base_with_suffix + ".xlsx"
+            writers.append((self._write_excel_export, excel_file, "✓ Excel-Datei gespeichert"))
+        
+        # Headers need a pass over all devices; rows are streamed to each writer
+        headers = self.export_headers(data)
+        
+        if len(writers) > 1:
+            # Independent files; file writes and openpyxl's zlib compression release the GIL
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(writers)) as executor:
+                futures = [executor.submit(write, filename, headers, data) for write, filename, _ in writers]
+                for future, (_, filename, message) in zip(futures, writers):
+                    future.result()
+                    self.log_message(f"{message}: {filename}")
+        else:
+            for write, filename, message in writers:
+                write(filename, headers, data)
+                self.log_message(f"{message}: {filename}")
 
     def _get_base_filename(self):
         """Get base filename for all exports"""
@@ -1428,109 +2107,13 @@ class ModbusExporterGUI:
             filetypes=[("All Files", "*.*")]
         )
 
-    def _save_original_data_with_base(self, data, base_file):
+    def _save_original_data_with_base(self, data, base_file, options=None):
         """Save data using the provided base filename"""
+        if options is None:
+            options = self._export_options()
+        
         # Add enhanced diagnostics suffix if enabled
-        diagnostics_suffix = "_ED" if self.enhanced_diagnostics_var.get() else ""
-        
-        # Save as CSV
-        if self.csv_var.get():
-            filename = base_file + diagnostics_suffix + ".csv"
-            header_extras, flattened_data = self.flatten_diagnostics(data)
-            fieldnames = ["DeviceID", "DeviceType", "RFID", "SerialNumber", "DeviceName", "DeviceLabel"] + header_extras
-            with open(filename, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for row in flattened_data:
-                    writer.writerow({k: row.get(k, "") for k in fieldnames})
-            self.log_message(f"✓ CSV-Datei gespeichert: {filename}")
-        
-        # Save as Excel
-        if self.excel_var.get() and EXCEL_AVAILABLE:
-            # Check if the base filename already ends with .xlsx to avoid double extension
-            base_with_suffix = base_file + diagnostics_suffix
-            if base_with_suffix.endswith('.xlsx'):
-                filename = base_with_suffix
-            else:
-                filename = base_with_suffix + ".xlsx"
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Modbus Export"
-            header_extras, flattened_data = self.flatten_diagnostics(data)
-            headers = ["DeviceID", "DeviceType", "RFID", "SerialNumber", "DeviceName", "DeviceLabel"] + header_extras
-            
-            # Add headers
-            ws.append(headers)
-            
-            # Add data rows
-            for row in flattened_data:
-                ws.append([row.get(h, "") for h in headers])
-            
-            # Apply conditional formatting for Signal Quality if present
-            if "Signal Quality" in headers:
-                signal_quality_col = headers.index("Signal Quality") + 1  # Excel columns are 1-indexed
-                signal_quality_col_letter = openpyxl.utils.get_column_letter(signal_quality_col)
-                
-                # Define color fills for different signal quality levels
-                from openpyxl.styles import PatternFill
-                excellent_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")  # Green
-                good_fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")      # Light Green
-                fair_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")      # Yellow
-                weak_fill = PatternFill(start_color="FF6600", end_color="FF6600", fill_type="solid")      # Orange
-                very_weak_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid") # Red
-                unknown_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")   # Gray
-                
-                # Apply formatting to each cell in the Signal Quality column
-                for row_num in range(2, len(flattened_data) + 2):  # Start from row 2 (after header)
-                    cell = ws[f"{signal_quality_col_letter}{row_num}"]
-                    signal_quality_value = str(cell.value).strip() if cell.value else ""
-                    
-                    if signal_quality_value == "Excellent":
-                        cell.fill = excellent_fill
-                    elif signal_quality_value == "Good":
-                        cell.fill = good_fill
-                    elif signal_quality_value == "Fair":
-                        cell.fill = fair_fill
-                    elif signal_quality_value == "Weak":
-                        cell.fill = weak_fill
-                    elif signal_quality_value == "Very Weak":
-                        cell.fill = very_weak_fill
-                    elif signal_quality_value == "Unknown" or signal_quality_value == "":
-                        cell.fill = unknown_fill
-            
-            # Apply conditional formatting for RSSI if present
-            if "RSSI" in headers:
-                rssi_col = headers.index("RSSI") + 1  # Excel columns are 1-indexed
-                rssi_col_letter = openpyxl.utils.get_column_letter(rssi_col)
-                
-                # Define color fills for different RSSI power levels
-                from openpyxl.styles import PatternFill
-                rssi_good_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")    # Green (0 to -65 dBm)
-                rssi_average_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid") # Yellow (-65 to -75 dBm)
-                rssi_poor_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")    # Red (< -75 dBm)
-                rssi_unknown_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid") # Gray (Unknown/NaN)
-                
-                # Apply formatting to each cell in the RSSI column
-                for row_num in range(2, len(flattened_data) + 2):  # Start from row 2 (after header)
-                    cell = ws[f"{rssi_col_letter}{row_num}"]
-                    rssi_value = str(cell.value).strip() if cell.value else ""
-                    
-                    try:
-                        if rssi_value and rssi_value.lower() != 'nan':
-                            rssi_float = float(rssi_value)
-                            if rssi_float >= -65:  # 0 to -65 dBm = Good
-                                cell.fill = rssi_good_fill
-                            elif rssi_float >= -75:  # -65 to -75 dBm = Average
-                                cell.fill = rssi_average_fill
-                            else:  # < -75 dBm = Poor
-                                cell.fill = rssi_poor_fill
-                        else:
-                            cell.fill = rssi_unknown_fill  # NaN or empty values
-                    except (ValueError, TypeError):
-                        cell.fill = rssi_unknown_fill  # Invalid values
-            
-            wb.save(filename)
-            self.log_message(f"✓ Excel-Datei gespeichert: {filename}")
+        self._do_export(data, base_file, options, options['suffix'])
 
     def _generate_sensor_pairing_sheet(self, data, base_file):
         """Generate an Excel sensor pairing sheet by merging Modbus data with JSON configuration"""
@@ -1546,31 +2129,34 @@ class ModbusExporterGUI:
         try:
             self.log_message(f"Loading JSON configuration from {json_file}")
             
-            # Load JSON configuration
-            with open(json_file, 'r') as json_f:
+            # Load JSON configuration; json detects the encoding of binary input itself,
+            # so skip text-mode decoding and read the file in large chunks
+            with open(json_file, 'rb', buffering=1 << 20) as json_f:
                 json_data = json.load(json_f)
             
             # Get sensors from JSON data
             sensors = json_data.get('sensors', [])
             self.log_message(f"Found {len(sensors)} sensors in configuration")
             
-            # Create a mapping from device ID to device data (since RFID formats might differ)
+            # Create a mapping from device ID and RFID to device data; keys are normalized
+            # once here (stripped, RFID upper-cased) since JSON formats might differ
+            # Each entry already holds the device columns of the sheet
             device_map = {}
             for device in data:
-                device_id = str(device.get('DeviceID', ''))
-                rfid = device.get('RFID', '')
+                device_id = str(device.get('DeviceID', '')).strip()
+                rfid = str(device.get('RFID', '')).strip().upper()
+                device_info = tuple(map(device.get, SENSOR_PAIRING_DEVICE_KEYS, _DEVICE_NOT_FOUND))
                 if device_id:
-                    device_map[device_id] = device
+                    device_map[device_id] = device_info
                 if rfid:
-                    device_map[rfid] = device
+                    device_map[rfid] = device_info
             
             # Use the provided base filename and append _SPS
             output_file = f"{base_file}_SPS.xlsx"
             
-            # Create Excel workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Sensor Pairing Sheet"
+            # Create Excel workbook; write-only since rows are only ever appended
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Sensor Pairing Sheet")
             
             # Updated headers with requested order (removed duplicate Description field)
             headers = [
@@ -1584,38 +2170,22 @@ class ModbusExporterGUI:
             
             # Process each sensor from JSON
             for sensor in sensors:
-                sensor_id = sensor.get('slaveId', '')
-                rfid = sensor.get('deviceAddress', '')
-                # Extract additional attributes from JSON
-                equipement = sensor.get('Equipement', '')
-                sensor_position = sensor.get('SensorPosition', '')
-                measured_point = sensor.get('MeasuredPoint', '')
-                cubicle_id = sensor.get('CubicleId', '')
-                cubicle_type = sensor.get('CubicleType', '')
-                feeder_id = sensor.get('FeederId', '')
-                circuit_breaker_id = sensor.get('CircuitBreakerId', '')
-                drawer_id = sensor.get('DrawerId', '')
-                
-                # Find matching device data - try multiple matching strategies
-                device_data = device_map.get(rfid, {})
-                if not device_data:
-                    # Try matching by slaveId (DeviceID)
-                    device_data = device_map.get(sensor_id, {})
+                # Pull all JSON attributes in one pass; missing keys become ''
+                (sensor_id, rfid, equipement, sensor_position, measured_point, cubicle_id,
+                 cubicle_type, feeder_id, circuit_breaker_id, drawer_id) = map(
+                    sensor.get, SENSOR_PAIRING_JSON_KEYS, _EMPTY_DEFAULTS)
                 
-                # Extract device information
-                device_type = device_data.get('DeviceType', 'Not Found')
-                serial_number = device_data.get('SerialNumber', 'Not Found')
-                device_name = device_data.get('DeviceName', 'Not Found')
-                device_label = device_data.get('DeviceLabel', 'Not Found')
+                # Find matching device data - by RFID first, then by slaveId (DeviceID)
+                device_info = (device_map.get(str(rfid).strip().upper())
+                               or device_map.get(str(sensor_id).strip())
+                               or _DEVICE_NOT_FOUND)
                 
                 # Create row data without enhanced diagnostics
-                row_data = [
-                    sensor_id, rfid, serial_number, device_type, device_name, device_label,
+                ws.append((
+                    sensor_id, rfid, *device_info,
                     equipement, sensor_position, measured_point, cubicle_id, cubicle_type,
                     feeder_id, circuit_breaker_id, drawer_id
-                ]
-                
-                ws.append(row_data)
+                ))
             
             # No conditional formatting needed for sensor pairing sheet
             
@@ -1640,74 +2210,99 @@ class ModbusExporterGUI:
 
     def update_live_diagnostics_table(self, live_data=None):
         """Update the live diagnostics table with data or clear it"""
-        # Clear existing data
-        for item in self.live_data_tree.get_children():
-            self.live_data_tree.delete(item)
-        
-        if live_data:
-            # Update timestamp
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.last_update_label.config(text=f"Last Update: {current_time}")
-            
-            # Add new data rows
-            for device in live_data:
-                device_id = device.get("DeviceID", "Unknown")
-                device_type = device.get("DeviceType", "Unknown")
-                device_name = device.get("DeviceName", "Unknown")
-                diagnostics = device.get("Diagnostics", {})
-                
-                # Extract values for table columns
-                rf_comm = decode_rf_communication_validity(diagnostics.get("RF Communication Validity", "N/A"))
-                comm_status = decode_communication_status(diagnostics.get("Communication Status", "N/A"))
-                signal_quality = diagnostics.get("Signal Quality", "N/A")
-                rssi = diagnostics.get("RSSI", "N/A")
-                lqi = diagnostics.get("LQI", "N/A")
-                gateway_per = diagnostics.get("Gateway PER", "N/A")
-                battery = diagnostics.get("Battery Voltage", "N/A")
-                
-                # Determine row color based on signal quality
-                row_tag = 'normal'
-                if signal_quality == "Excellent":
-                    row_tag = 'excellent'
-                elif signal_quality == "Good":
-                    row_tag = 'good'
-                elif signal_quality == "Fair":
-                    row_tag = 'fair'
-                elif signal_quality == "Weak":
-                    row_tag = 'poor'
-                
-                # Prepare data for all columns
-                all_data = {
-                    "DeviceID": device_id,
-                    "DeviceType": device_type,
-                    "RFID": device.get("RFID", "Unknown"),
-                    "SerialNumber": device.get("SerialNumber", "Unknown"),
-                    "DeviceName": device_name,
-                    "RFCommunication": rf_comm,
-                    "CommStatus": comm_status,
-                    "SignalQuality": signal_quality,
-                    "RSSI": rssi,
-                    "LQI": lqi,
-                    "GatewayPER": gateway_per,
-                    "Battery": battery
-                }
-                
-                # Get visible columns (always visible + optional selected columns)
-                visible_columns = self.always_visible_columns + [col for col in self.optional_columns if self.column_visibility[col].get()]
-                
-                # Create values list for only visible columns
-                values = [all_data.get(col, "") for col in visible_columns]
-                
-                # Add row to table with color tag
-                self.live_data_tree.insert("", "end", values=values, tags=(row_tag,))
-            
-            # Auto-adjust column widths based on content
-            self._auto_adjust_column_widths()
-        else:
+        if not live_data:
+            # Clear existing data in one call
+            self.live_data_tree.delete(*self.live_data_tree.get_children())
+            self.live_row_items = []
+            self.live_rows = []
+            self.live_data_snapshot = None
             # Clear timestamp when no data
             self.last_update_label.config(text="Last Update: Never")
+            return
+        
+        # Update timestamp
+        current_time = datetime.now().strftime("%H:%M:%S")
+        self.last_update_label.config(text=f"Last Update: {current_time}")
         
-        self.root.update_idletasks()
+        # Stable networks often report exactly the same values again; the
+        # C-level deep comparison is far cheaper than decoding every row
+        if live_data == self.live_data_snapshot:
+            return
+        self.live_data_snapshot = live_data
+        
+        # all_data below has a key for every column; pull them out in column order in one C call
+        row_values = itemgetter(*self.live_data_tree_columns)
+        rows = []
+        for device in live_data:
+            # One pass per dict; missing identity fields show "Unknown", missing readings "N/A"
+            device_id, device_type, device_name, rfid, serial_number = map(
+                device.get, LIVE_DEVICE_KEYS, _UNKNOWN_DEFAULTS)
+            diagnostics = device.get("Diagnostics", {})
+            
+            # Extract values for table columns
+            rf_raw, comm_raw, signal_quality, rssi, lqi, gateway_per, battery = map(
+                diagnostics.get, LIVE_DIAGNOSTIC_KEYS, _NA_DEFAULTS)
+            rf_comm = decode_rf_communication_validity(rf_raw)
+            comm_status = decode_communication_status(comm_raw)
+            
+            # Determine row color based on signal quality
+            row_tag = LIVE_ROW_TAGS.get(signal_quality, 'normal')
+            
+            # Prepare data for all columns
+            all_data = {
+                "DeviceID": device_id,
+                "DeviceType": device_type,
+                "RFID": rfid,
+                "SerialNumber": serial_number,
+                "DeviceName": device_name,
+                "RFCommunication": rf_comm,
+                "CommStatus": comm_status,
+                "SignalQuality": signal_quality,
+                "RSSI": rssi,
+                "LQI": lqi,
+                "GatewayPER": gateway_per,
+                "Battery": battery
+            }
+            
+            # Values for all columns; hidden ones are filtered by displaycolumns
+            values = row_values(all_data)
+            rows.append((values, row_tag))
+        
+        # Nothing changed since the last refresh: leave the tree alone
+        if rows == self.live_rows:
+            return
+        
+        # Rewrite only the rows whose content changed
+        items = self.live_row_items
+        for item, old_row, row in zip(items, self.live_rows, rows):
+            if old_row != row:
+                self.live_data_tree.item(item, values=row[0], tags=(row[1],))
+        
+        # Add rows for extra devices, or drop rows of devices that disappeared
+        if len(rows) > len(items):
+            items = items + [self.live_data_tree.insert("", "end", values=values, tags=(row_tag,))
+                             for values, row_tag in rows[len(items):]]
+        elif len(rows) < len(items):
+            self.live_data_tree.delete(*items[len(rows):])
+            items = items[:len(rows)]
+        
+        self.live_row_items = items
+        self.live_rows = rows
+        
+        # Auto-adjust column widths based on content, once Tk is idle
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Schedule a column width pass; repeated requests within 50 ms share one pass"""
+        if self.refresh_pending:
+            return
+        self.refresh_pending = True
+        self.root.after(50, self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Run the deferred column width pass"""
+        self.refresh_pending = False
+        self._auto_adjust_column_widths()
 
     def toggle_live_diagnostics(self):
         """Toggle live diagnostics on/off"""
@@ -1734,8 +2329,13 @@ class ModbusExporterGUI:
         self.log_message("Starting live diagnostics monitoring...")
         self.update_live_diagnostics_table()
         
-        # Start live diagnostics in separate thread
-        self.live_diagnostics_thread = threading.Thread(target=self._live_diagnostics_worker, args=(ip,), daemon=True)
+        # Start live diagnostics in separate thread; each run gets its own stop event
+        # so a worker still waiting from a previous run cannot be revived
+        self.live_stop_event = threading.Event()
+        # Tk variables must be read here on the main thread, not in the worker
+        max_workers = parallel_workers(self)
+        self.live_diagnostics_thread = threading.Thread(target=self._live_diagnostics_worker,
+                                                        args=(ip, self.live_stop_event, max_workers), daemon=True)
         self.live_diagnostics_thread.start()
 
     def stop_live_diagnostics(self):
@@ -1744,6 +2344,7 @@ class ModbusExporterGUI:
             return
         
         self.live_diagnostics_enabled = False
+        self.live_stop_event.set()
         self.live_diag_btn.config(text="Start Live Diagnostics", bg='#4CAF50')
         # Update status icon to red when stopped
         self.status_icon.config(fg='#ff5555')
@@ -1751,117 +2352,85 @@ class ModbusExporterGUI:
         self.log_message("Live diagnostics monitoring stopped")
         self.update_live_diagnostics_table()
 
-    def _live_diagnostics_worker(self, ip):
+    def _live_diagnostics_worker(self, ip, stop_event, max_workers=1):
         """Worker thread for live diagnostics monitoring"""
+        # Tk is not thread-safe: every table update is handed to the main loop
+        # Parallel polls keep their per-worker connections open for the whole run
+        client_pool = None
         try:
-            while self.live_diagnostics_enabled:
+            if MODBUS_AVAILABLE and max_workers > 1:
+                client_pool = ClientWorkerPool(ip, max_workers)
+            while not stop_event.is_set():
                 if MODBUS_AVAILABLE:
                     # Collect live data
-                    live_data = self._collect_live_diagnostics_data(ip)
-                    if live_data:
-                        self.update_live_diagnostics_table(live_data)
-                    else:
-                        self.update_live_diagnostics_table()
+                    live_data = self._collect_live_diagnostics_data(ip, client_pool)
                 else:
                     # Simulation mode
-                    simulated_data = self._simulate_live_diagnostics_data()
-                    self.update_live_diagnostics_table(simulated_data)
+                    live_data = self._simulate_live_diagnostics_data()
+                self.root.after(0, self._show_live_data, live_data or None, stop_event)
                 
-                # Wait for 30 seconds before next update
-                for i in range(30):
-                    if not self.live_diagnostics_enabled:
-                        break
-                    time.sleep(1)
+                # Wait for 30 seconds before next update; stop wakes us immediately
+                if stop_event.wait(30):
+                    break
                     
         except Exception as e:
             self.log_message(f"Live diagnostics error: {str(e)}")
-            self.update_live_diagnostics_table()
-            self.stop_live_diagnostics()
+            self.root.after(0, self.stop_live_diagnostics)
+        finally:
+            if client_pool:
+                client_pool.close()
+
+    def _show_live_data(self, live_data, stop_event):
+        """Apply a poll result on the main thread unless its run was stopped meanwhile"""
+        if not stop_event.is_set():
+            self.update_live_diagnostics_table(live_data)
 
-    def _collect_live_diagnostics_data(self, ip):
+    def _collect_live_diagnostics_data(self, ip, client_pool=None):
         """Collect live diagnostics data from the device"""
         try:
-            client = ModbusClient(ip)
-            if not client.connect():
-                return None
-            
-            # Get device IDs
-            device_ids = get_device_ids(client)
-            if not device_ids:
-                client.close()
-                return None
-            
-            live_data = []
-            for device_id in device_ids:
-                # Get device type first
-                ref_regs = read_registers(client, device_id, 31060, 16)
-                ref = decode_ascii_cached(ref_regs) if ref_regs else ""
-                
-                device_type = ""
-                if ref == "EMS59443":
-                    device_type = "CL110"
-                elif ref == "EMS59440":
-                    device_type = "TH110"
-                elif ref == "SMT10020":
-                    device_type = "HeatTag"
-                else:
-                    device_type = "Unknown"
+            # Reuse the pooled connection instead of reconnecting every refresh cycle
+            with connection_pool.client_lock(ip):
+                client = connection_pool.get_connection(ip)
+                if not client:
+                    return None
                 
-                # Get device name
-                device_name_regs = read_registers(client, device_id, 31000, 10)
-                device_name = decode_ascii_cached(device_name_regs) if device_name_regs else "Unknown"
+                # Get device IDs
+                device_ids = get_device_ids(client)
+                if not device_ids:
+                    return None
                 
-                # Get RFID
-                rfid_regs = read_registers(client, device_id, 31026, 6)
-                rfid = ""
-                if rfid_regs:
-                    hex_str = "".join(f"{reg:04X}" for reg in rfid_regs if reg > 0)
-                    rfid = hex_str[:8]
-                
-                # Get Serial Number
-                sn_regs = read_registers(client, device_id, 31088, 10)
-                serial_number = decode_ascii_cached(sn_regs) if sn_regs else "Unknown"
-                
-                # Get enhanced diagnostics
-                diagnostics = read_enhanced_diagnostics(client, device_id, device_type)
-                
-                device_data = {
-                    "DeviceID": device_id,
-                    "DeviceType": device_type,
-                    "DeviceName": device_name,
-                    "RFID": rfid,
-                    "SerialNumber": serial_number,
-                    "Diagnostics": diagnostics
-                }
+                # Devices are independent; poll several at once over the pool's private connections
+                if client_pool and len(device_ids) > 1:
+                    live_data = client_pool.map(collect_live_device, device_ids)
+                else:
+                    live_data = [collect_live_device(client, device_id) for device_id in device_ids]
                 
-                live_data.append(device_data)
-            
-            client.close()
-            return live_data
+                return live_data
             
         except Exception as e:
             self.log_message(f"Error collecting live diagnostics data: {str(e)}")
             return None
 
-    def _simulate_live_diagnostics_data(self):
+    def _simulate_live_diagnostics_data(self, device_count=3):
         """Simulate live diagnostics data for demo purposes"""
-        import random
+        # Bind the RNG methods once for the whole batch
+        uniform, randint, choice = random.uniform, random.randint, random.choice
         
-        # Simulate data for 3 devices
+        # Simulate data for device_count devices
         simulated_data = []
-        for i in range(3):
+        for i in range(device_count):
             device_type = "CL110" if i % 2 == 0 else "TH110"
             diagnostics = {
                 "RF Communication Validity": 1,
                 "Communication Status": 1,
-                "Gateway PER": round(random.uniform(5.0, 25.0), 2),
-                "RSSI": round(random.uniform(-85.0, -45.0), 2),
-                "LQI": random.randint(40, 80),
-                "Signal Quality": random.choice(["Good", "Fair", "Excellent"])
+                "Gateway PER": round(uniform(5.0, 25.0), 2),
+                "RSSI": round(uniform(-85.0, -45.0), 2),
+                "LQI": randint(40, 80),
+                "Signal Quality": choice(SIMULATED_SIGNAL_QUALITIES)
             }
             
             if device_type == "CL110":
-                diagnostics["Battery Voltage"] = round(random.uniform(3.0, 3.6), 2)
+                diagnostics["Battery Voltage"] = round(uniform(3.0, 3.6), 2)
             
             device_data = {
                 "DeviceID": 100 + i,
@@ -1878,107 +2447,56 @@ class ModbusExporterGUI:
 
     def _auto_adjust_column_widths(self):
         """Auto-adjust column widths based on content with improved calculations"""
-        # Get list of visible columns (always visible + optional selected columns)
-        visible_columns = self.always_visible_columns + [col for col in self.optional_columns if self.column_visibility[col].get()]
+        visible_columns = self.visible_columns
         
-        # Skip auto-resize for columns that should have fixed widths
-        fixed_width_columns = ["DeviceType", "RFID"]
+        # Measure the values last rendered, kept in memory, instead of reading them back from Tk
+        rows = [values for values, _ in self.live_rows]
         
-        for col in visible_columns:
-            # Skip auto-resize for fixed width columns
-            if col in fixed_width_columns:
+        # Rows carry values for every column, so index by position in the full column list
+        for col_index, col in enumerate(self.live_data_tree_columns):
+            # Skip hidden columns and fixed width columns
+            if col not in visible_columns or col in LIVE_FIXED_WIDTH_COLUMNS:
                 continue
-            # Get the header text width (headers are bold, so need more space)
-            header_text = self.live_data_tree.heading(col, 'text')
-            header_width = len(header_text) * 12  # Bold headers need more space
+            # Get the header text width in the bold heading font; headings never change
+            header_width = self.live_heading_widths.get(col)
+            if header_width is None:
+                header_text = self.live_data_tree.heading(col, 'text')
+                header_width = self.live_heading_widths[col] = self.measure_heading_text(header_text)
             
-            # Find the maximum width for this column
+            # Find the maximum width for this column; measure each distinct value once
             max_content_width = 0
-            for item in self.live_data_tree.get_children():
-                visible_col_index = visible_columns.index(col)
-                try:
-                    value = str(self.live_data_tree.item(item, 'values')[visible_col_index])
-                    # Better content width calculation - account for different character widths
-                    content_width = len(value) * 10  # Regular text width
-                    max_content_width = max(max_content_width, content_width)
-                except IndexError:
-                    continue
+            for value in {str(values[col_index]) for values in rows}:
+                max_content_width = max(max_content_width, self.measure_cell_text(value))
             
             # Take the maximum of header and content widths
             calculated_width = max(header_width, max_content_width)
             
-            # Set column-specific minimum and maximum widths with fixed widths for Type and RFID
-            column_limits = {
-                "DeviceID": {"min": 60, "max": 120},
-                "DeviceType": {"min": 110, "max": 110},  # Fixed width for "HeatTag" (7 chars)
-                "RFID": {"min": 120, "max": 120},  # Fixed width for 8 chars (increased)
-                "SerialNumber": {"min": 120, "max": 180},
-                "DeviceName": {"min": 120, "max": 300},
-                "RFCommunication": {"min": 80, "max": 140},
-                "CommStatus": {"min": 100, "max": 180},
-                "SignalQuality": {"min": 100, "max": 150},
-                "RSSI": {"min": 80, "max": 140},
-                "LQI": {"min": 60, "max": 100},
-                "GatewayPER": {"min": 80, "max": 140},
-                "Battery": {"min": 80, "max": 140}
-            }
-            
-            limits = column_limits.get(col, {"min": 60, "max": 200})
-            min_width = limits["min"]
-            max_width_limit = limits["max"]
+            # Add generous padding and apply the column-specific limits
+            min_width, max_width_limit = LIVE_COLUMN_LIMITS.get(col, LIVE_DEFAULT_COLUMN_LIMITS)
+            final_width = max(min_width, min(calculated_width + LIVE_COLUMN_PADDING, max_width_limit))
             
-            # Add generous padding and apply limits
-            final_width = calculated_width + 30  # More generous padding
-            final_width = min(final_width, max_width_limit)
-            final_width = max(min_width, final_width)
-            
-            # Apply the width
-            self.live_data_tree.column(col, width=final_width)
+            # Apply the width, only to columns whose width actually changed
+            if self.live_column_widths.get(col) != final_width:
+                self.live_data_tree.column(col, width=final_width)
+                self.live_column_widths[col] = final_width
 
     def update_column_visibility(self):
         """Update which columns are visible in the live diagnostics table"""
-        # Prevent GUI updates during column reconfiguration
-        self.root.update_idletasks()
+        # Snapshot the checkbox states once per toggle
+        visible = {col: var.get() for col, var in self.column_visibility.items()}
         
         # Get list of visible columns (always visible + optional selected columns)
-        visible_columns = self.always_visible_columns + [col for col in self.optional_columns if self.column_visibility[col].get()]
-        
-        # Update the tree view to show only visible columns
-        self.live_data_tree.config(columns=visible_columns)
-        
-        # Reset column headings for visible columns
-        column_display_names = {
-            "DeviceID": "ID",
-            "DeviceType": "Type",
-            "RFID": "RFID",
-            "SerialNumber": "Serial Number",
-            "DeviceName": "Name",
-            "RFCommunication": "RF Com.",
-            "CommStatus": "Com. Status",
-            "SignalQuality": "Signal Quality",
-            "RSSI": "RSSI (dBm)",
-            "LQI": "LQI",
-            "GatewayPER": "Gateway PER",
-            "Battery": "Battery (V)"
-        }
-        
-        for col in visible_columns:
-            self.live_data_tree.heading(col, text=column_display_names.get(col, col))
+        visible_columns = tuple(self.always_visible_columns + [col for col in self.optional_columns if visible[col]])
+        if visible_columns == self.visible_columns:
+            return
+        self.visible_columns = visible_columns
         
-        # Clear existing data and refresh if live diagnostics is running
-        for item in self.live_data_tree.get_children():
-            self.live_data_tree.delete(item)
-        
-        # If live diagnostics is running, trigger a refresh
-        if self.live_diagnostics_enabled:
-            # The data will be refreshed on the next update cycle
-            pass
+        # Rows keep values for every column, so only the displayed subset changes;
+        # headings, anchors and existing rows stay as they are
+        self.live_data_tree.config(displaycolumns=visible_columns)
         
         # Auto-adjust column widths without affecting overall layout
-        self._auto_adjust_column_widths()
-        
-        # Ensure the main window geometry remains stable
-        self.root.update_idletasks()
+        self._schedule_refresh()
 
     def on_closing(self):
         """Handle application closing"""
@@ -1994,9 +2512,15 @@ class ModbusExporterGUI:
                     self.stop_export()
                 if self.live_diagnostics_enabled:
                     self.stop_live_diagnostics()
-                self.root.after(1000, self.root.destroy)  # Give time for cleanup
+                self.root.after(1000, self._destroy)  # Give time for cleanup
         else:
-            self.root.destroy()
+            self._destroy()
+    
+    def _destroy(self):
+        """Close pooled Modbus connections and destroy the window"""
+        self.io_pool.shutdown(wait=False)
+        connection_pool.close_all()
+        self.root.destroy()
 
 def main():
     """Main application entry point"""